@@ -4,9 +4,9 @@ Author: Manikanta Varaganti
 Date: November 10, 2023
 Description: This module contains the Class Cache that can be instantiated as L1, L2, so on.
 """
-from math import *
+from math import log2
 from cache_block import CacheBlock
-from utils import *
+from utils import hexToBin, binToHex, binToDec
 from collections import deque
 
 
@@ -28,10 +28,15 @@ class Cache:
         self.inclusion = inclusionPolicy
         self.writeBack = False
         self.evictedAddress = None
+        self.evictedDirty = False
         self.evicted = False
         self.cache_level = cacheLevel
         self.next_cache_level = None
 
+        # set and way of the block of the last hit or allocation
+        self.lastIndex = None
+        self.lastWay = None
+
         # cache metrics
         self.reads = 0
         self.read_hits = 0
@@ -41,6 +46,7 @@ class Cache:
         self.write_misses = 0
         self.write_backs = 0
         self.mem_write_back = 0
+        self.fills = 0
 
         if self.associativity == 0:
             # fully associative cache
@@ -64,6 +70,9 @@ class Cache:
             [CacheBlock() for _ in range(self.associativity)] for _ in range(self.sets)
         ]
 
+        # tag index of every set, maps a tag to its way for O(1) lookups
+        self.tagIndex = [{} for _ in range(self.sets)]
+
         # initialize the LRU & FIFO counters
         self.LRU_matrix = [([0] * self.associativity) for row in range(self.sets)]
         self.FIFO_queue = [
@@ -83,15 +92,21 @@ class Cache:
         else:
             return binToDec(binAddr)
 
+    # returns the tag address and the index value, converting the address once
+    def _get_tag_and_index(self, address):
+        binAddr = hexToBin(address)
+        tag = binToHex(binAddr[: self.tag_width])
+        indexAddr = binAddr[self.tag_width : self.tag_width + self.index_width]
+        if indexAddr == "":
+            return tag, 0
+        return tag, binToDec(indexAddr)
+
     # returns the cache cell if found
     def _get_cache_cell(self, address):
-        tag = self._get_tag_address(address)
-        index = self._get_index_value(address)
-        for way in range(self.associativity):
-            if self.cacheLines[index][way]._getTag() == tag:
-                return self.cacheLines[index][way]
-            else:
-                None
+        tag, index = self._get_tag_and_index(address)
+        way = self.tagIndex[index].get(tag)
+        if way is not None:
+            return self.cacheLines[index][way]
 
     # updates the LRU FIFO counters
     def _update_block(self, index, way):
@@ -119,8 +134,7 @@ class Cache:
 
     # replaces the cache block
     def _replace_block(self, address, operation):
-        tag = self._get_tag_address(address)
-        index = self._get_index_value(address)
+        tag, index = self._get_tag_and_index(address)
 
         # find a cache block that needs to be replaced by a replacement policy
         blockToBeEvicted = self._find_block_to_replace(index)
@@ -129,12 +143,12 @@ class Cache:
         if blockToBeEvicted.isDirty:
             self.write_backs += 1
             self.writeBack = True  # issues writeback to next level of memory
-            self.evictedAddress = blockToBeEvicted._getAddress()
 
-        # used for invalidating L1 block incase of inclusion violation
-        if self.cache_level == 2:
-            self.evicted = True
-            self.evictedAddress = blockToBeEvicted._getAddress()
+        # used for invalidating L1 block incase of inclusion violation and for
+        # moving the evicted block to the victim cache or exclusive L2
+        self.evicted = True
+        self.evictedAddress = blockToBeEvicted._getAddress()
+        self.evictedDirty = blockToBeEvicted.isDirty
 
         if operation == "w":
             blockToBeEvicted._setDirty()
@@ -142,9 +156,13 @@ class Cache:
             blockToBeEvicted._resetDirty()
 
         evictedBlockWay = blockToBeEvicted._getWay()
+        del self.tagIndex[index][blockToBeEvicted._getTag()]
+        self.tagIndex[index][tag] = evictedBlockWay
         blockToBeEvicted._setTag(tag)
         blockToBeEvicted._setAddress(address)
         self._update_block(index, evictedBlockWay)
+        self.lastIndex = index
+        self.lastWay = evictedBlockWay
 
     # invalidates a L1 cache block incase of inclusion violation
     def invalidate_block(self, address):
@@ -157,12 +175,29 @@ class Cache:
                     1  # L1 to main memory write back incase of dirty block
                 )
 
+            del self.tagIndex[self._get_index_value(address)][tag]
             cacheCell._resetAll()  # reset all the properties of a block
 
+    # removes a block that moves to another level, returns its dirty bit
+    def remove_block(self, address):
+        tag = self._get_tag_address(address)
+        cacheCell = self._get_cache_cell(address)
+        if cacheCell is None:
+            return False
+
+        dirty = cacheCell.isDirty
+        del self.tagIndex[self._get_index_value(address)][tag]
+        cacheCell._resetAll()
+        return dirty
+
+    # fills a block evicted from the upper level (exclusive hierarchy)
+    def fill_block(self, address, dirty):
+        self.fills += 1
+        self.allocate_block(address, "w" if dirty else "r")
+
     # allocates a block in cache
     def allocate_block(self, address, operation):
-        tag = self._get_tag_address(address)
-        index = self._get_index_value(address)
+        tag, index = self._get_tag_and_index(address)
 
         available = False
         if self.associativity > 1:
@@ -170,10 +205,13 @@ class Cache:
             for way in range(self.associativity):
                 if self.cacheLines[index][way]._getValidity() == False:
                     self.cacheLines[index][way]._setTag(tag)
+                    self.tagIndex[index][tag] = way
                     self.cacheLines[index][way]._setWay(way)
                     self.cacheLines[index][way]._setValidity()
                     self.cacheLines[index][way]._setAddress(address)
                     self._update_block(index, way)
+                    self.lastIndex = index
+                    self.lastWay = way
                     # set dirty bit as true if a write is issued
                     if operation == "w":
                         self.cacheLines[index][way]._setDirty()
@@ -189,10 +227,13 @@ class Cache:
             # direct maaped cache
             if self.cacheLines[index][0]._getTag() is None:
                 self.cacheLines[index][0]._setTag(tag)
+                self.tagIndex[index][tag] = 0
                 self.cacheLines[index][0]._setWay(0)
                 self.cacheLines[index][0]._setValidity()
                 self.cacheLines[index][0]._setAddress(address)
                 self._update_block(index, 0)
+                self.lastIndex = index
+                self.lastWay = 0
 
                 if operation == "w":
                     self.cacheLines[index][0]._setDirty()
@@ -207,10 +248,13 @@ class Cache:
             for way in range(ways):
                 if self.cacheLines[0][way]._getValidity() == False:
                     self.cacheLines[0][way]._setTag(tag)
+                    self.tagIndex[0][tag] = way
                     self.cacheLines[0][way]._setWay(way)
                     self.cacheLines[0][way]._setValidity()
                     self.cacheLines[0][way]._setAddress(address)
                     self._update_block(0, way)
+                    self.lastIndex = 0
+                    self.lastWay = way
                     # set dirty bit as true if a write is issued
                     if operation == "w":
                         self.cacheLines[0][way]._setDirty()
@@ -223,6 +267,17 @@ class Cache:
                 # replace block if contents are full
                 self._replace_block(address, operation)
 
+    # applies repeated hits to the block of the last request in one step
+    def repeat_hits(self, reads, writes):
+        self.reads += reads
+        self.read_hits += reads
+        self.writes += writes
+        self.write_hits += writes
+        if writes > 0:
+            self.cacheLines[self.lastIndex][self.lastWay]._setDirty()
+        if self.replacement_policy == "0":
+            self._update_block(self.lastIndex, self.lastWay)
+
     # print the LRU FIFO counters
     def _print_LRUFIFO_contents(self):
         if self.replacement_policy == "0":
@@ -234,6 +289,7 @@ class Cache:
     def cache_request(self, address, operation):
         self.writeBack = False
         self.evictedAddress = None
+        self.evictedDirty = False
         self.evicted = False
 
         if operation == "r":
@@ -241,11 +297,10 @@ class Cache:
         else:
             self.writes += 1
 
-        tag = self._get_tag_address(address)
-        index = self._get_index_value(address)
-        cacheCell = self._get_cache_cell(address)
+        tag, index = self._get_tag_and_index(address)
+        way = self.tagIndex[index].get(tag)
 
-        if cacheCell is None:
+        if way is None:
             # miss case
             if operation == "r":
                 self.read_misses += 1
@@ -255,7 +310,8 @@ class Cache:
 
         else:
             # hit case
-            way = cacheCell._getWay()
+            self.lastIndex = index
+            self.lastWay = way
             if operation == "w":
                 self.cacheLines[index][way]._setDirty()
             if self.replacement_policy == "0":
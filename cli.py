@@ -0,0 +1,360 @@
+"""
+Module: cli.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains the command line entry point of the simulator with
+the subcommands run, sweep, convert-trace and bench. Configurations are validated before
+any trace is read, and the simulator modules are imported only by the subcommands that
+need them.
+"""
+import argparse
+import json
+import os
+import sys
+
+from sim_config import normalize_config, validate_config
+
+SUBCOMMANDS = ("run", "sweep", "convert-trace", "bench")
+
+
+# adds the positional arguments of a simulator configuration
+def _add_config_arguments(parser):
+    parser.add_argument("block_size", type=int, help="block size in bytes")
+    parser.add_argument("L1_size", type=int, help="L1 cache size in bytes")
+    parser.add_argument(
+        "L1_assoc", type=int, help="L1 associativity, 0 is fully-associative"
+    )
+    parser.add_argument("L2_size", type=int, help="L2 cache size in bytes, 0 for no L2")
+    parser.add_argument(
+        "L2_assoc", type=int, help="L2 associativity, 0 is fully-associative"
+    )
+    parser.add_argument("replace_policy", help="0 for LRU, 1 for FIFO")
+    parser.add_argument(
+        "inclusion_policy", help="0 for non-inclusive, 1 for inclusive, 2 for exclusive"
+    )
+    parser.add_argument("trace_file", help="trace file in the traces directory")
+    parser.add_argument(
+        "victim_entries", type=int, nargs="?", default=0, help="victim cache blocks"
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="collapse runs of accesses to the same block before simulating",
+    )
+
+
+# returns the validated configuration of the arguments, exits on an invalid one
+def _config_from_args(parser, args):
+    config = normalize_config(
+        {
+            "block_size": args.block_size,
+            "L1_size": args.L1_size,
+            "L1_assoc": args.L1_assoc,
+            "L2_size": args.L2_size,
+            "L2_assoc": args.L2_assoc,
+            "replace_policy": args.replace_policy,
+            "inclusion_policy": args.inclusion_policy,
+            "victim_entries": args.victim_entries,
+            "compress": args.compress,
+        }
+    )
+    errors = validate_config(config)
+    if errors:
+        parser.error("; ".join(errors))
+    _check_trace(parser, args.trace_file)
+    return config
+
+
+# exits if the trace file does not exist
+def _check_trace(parser, trace_file):
+    if not os.path.isfile("traces/" + trace_file):
+        parser.error(f"trace file traces/{trace_file} does not exist")
+
+
+# simulates one configuration
+def run_command(parser, args):
+    config = _config_from_args(parser, args)
+
+    timing_model = None
+    if args.cacti_table is not None:
+        from timing import TimingModel, load_cacti_table
+
+        levels = [(config["L1_size"], config["L1_assoc"])]
+        if config["L2_size"] != 0:
+            levels.append((config["L2_size"], config["L2_assoc"]))
+        try:
+            timing_model = TimingModel.from_cacti_table(
+                load_cacti_table(args.cacti_table),
+                config["block_size"],
+                levels,
+                memoryLatency=args.memory_latency,
+                bandwidth=args.bandwidth,
+                mshrs=args.mshrs,
+                victimHitTime=args.victim_hit_time,
+            )
+        except (OSError, ValueError) as error:
+            parser.error(str(error))
+
+    from sim_cache import CacheSimulator
+
+    try:
+        cacheSimulator = CacheSimulator.from_config(
+            config, args.trace_file, timing_model=timing_model
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    results = cacheSimulator.run()
+    cacheSimulator.print_results(
+        results, output_format=args.format, contents=not args.no_contents
+    )
+
+
+# runs a sweep configuration in a worker process
+def _run_sweep_job(config, trace_file, trace, records):
+    from sim_cache import CacheSimulator
+
+    return CacheSimulator.from_config(
+        config, trace_file, trace=trace, records=records
+    ).run()
+
+
+# returns the configurations of a sweep document paired with their trace files, exits
+# listing every error. Precompiled documents are validated again, they may have been
+# edited since they were written.
+def _sweep_configs(parser, document, default_trace):
+    precompiled = isinstance(document, dict) and document.get("precompiled") is True
+    configs = document.get("configs") if precompiled else document
+    if not isinstance(configs, list) or not all(
+        isinstance(config, dict) for config in configs
+    ):
+        parser.error(
+            "the configurations must be a JSON list of objects, or a precompiled "
+            '{"precompiled": true, "configs": [...]} document'
+        )
+
+    output = []
+    errors = []
+    for i, config in enumerate(configs):
+        config = dict(config)
+        trace_file = config.pop("trace_file", default_trace)
+        if trace_file is None:
+            errors.append(f"config {i}: no trace_file and no --trace given")
+        elif not isinstance(trace_file, str):
+            errors.append(
+                f"config {i}: trace_file must be a string, got {trace_file!r}"
+            )
+        elif not os.path.isfile("traces/" + trace_file):
+            errors.append(f"config {i}: trace file traces/{trace_file} does not exist")
+        try:
+            config = normalize_config(config)
+        except ValueError as error:
+            errors.append(f"config {i}: {error}")
+            continue
+        errors += [f"config {i}: {error}" for error in validate_config(config)]
+        output.append((config, trace_file))
+    if errors:
+        parser.error("\n  " + "\n  ".join(errors))
+    return output
+
+
+# simulates every configuration of a JSON file, or precompiles them
+def sweep_command(parser, args):
+    try:
+        with open(args.configs, "r") as file:
+            document = json.load(file)
+    except (OSError, ValueError) as error:
+        parser.error(f"cannot read {args.configs}: {error}")
+    configs = _sweep_configs(parser, document, args.trace)
+
+    if args.precompile is not None:
+        with open(args.precompile, "w") as file:
+            configs = [
+                dict(config, trace_file=trace_file) for config, trace_file in configs
+            ]
+            json.dump({"precompiled": True, "configs": configs}, file, indent=2)
+        print(f"precompiled {len(configs)} configurations to {args.precompile}")
+        return
+
+    from trace_reader import compress_trace, read_trace
+
+    # every trace is decoded once and shared by its configurations, and compressed
+    # configurations share the records of their trace and block size
+    traces = {}
+    records = {}
+    jobs = []
+    for config, trace_file in configs:
+        if trace_file not in traces:
+            traces[trace_file] = read_trace(trace_file)
+        if config["compress"]:
+            key = (trace_file, config["block_size"])
+            if key not in records:
+                records[key] = compress_trace(traces[trace_file], config["block_size"])
+            jobs.append((config, trace_file, None, records[key]))
+        else:
+            jobs.append((config, trace_file, traces[trace_file], None))
+
+    if args.workers > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = [executor.submit(_run_sweep_job, *job) for job in jobs]
+            results = [future.result() for future in futures]
+    else:
+        results = [_run_sweep_job(*job) for job in jobs]
+
+    if args.format == "csv":
+        for i, result in enumerate(results):
+            sys.stdout.write(result.to_csv(header=i == 0))
+    else:
+        print(json.dumps([result.to_dict() for result in results], indent=2))
+
+
+# converts a trace between the text and the binary format
+def convert_trace_command(parser, args):
+    _check_trace(parser, args.input)
+    from trace_reader import encode_binary_trace, read_trace
+
+    trace = read_trace(args.input)
+    output_format = args.to
+    if output_format is None:
+        output_format = "binary" if args.output.endswith(".bin") else "text"
+
+    if output_format == "binary":
+        with open("traces/" + args.output, "wb") as file:
+            file.write(encode_binary_trace(trace))
+    else:
+        with open("traces/" + args.output, "w") as file:
+            for mode, address in trace:
+                file.write(f"{mode} {address}\n")
+    print(f"converted {len(trace)} requests to traces/{args.output} ({output_format})")
+
+
+# measures the time to decode the trace, construct the caches and simulate
+def bench_command(parser, args):
+    config = _config_from_args(parser, args)
+    from time import perf_counter
+
+    from sim_cache import CacheSimulator
+    from trace_reader import read_trace
+
+    start = perf_counter()
+    trace = read_trace(args.trace_file)
+    decode_time = perf_counter() - start
+
+    construction_times = []
+    simulation_times = []
+    for _ in range(args.repeat):
+        start = perf_counter()
+        cacheSimulator = CacheSimulator.from_config(
+            config, args.trace_file, trace=trace
+        )
+        construction_times.append(perf_counter() - start)
+        start = perf_counter()
+        cacheSimulator.run()
+        simulation_times.append(perf_counter() - start)
+
+    best = min(simulation_times)
+    print("===== Benchmark =====")
+    print(f"requests:              {len(trace)}")
+    print(f"trace decode:          {decode_time:.6f} s")
+    print(f"cache construction:    {min(construction_times):.6f} s")
+    print(f"simulation (best of {args.repeat}): {best:.6f} s")
+    print(f"requests per second:   {len(trace) / best:.0f}")
+
+
+# argparse type of counts that must be at least 1
+def _positive_int(value):
+    try:
+        count = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"must be an integer, got {value!r}")
+    if count < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {count}")
+    return count
+
+
+# returns the argument parser with all subcommands
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="sim_cache", description="generic cache simulator"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="simulate one configuration")
+    _add_config_arguments(run_parser)
+    run_parser.add_argument(
+        "--format",
+        choices=["text", "json", "csv"],
+        default="text",
+        help="output format",
+    )
+    run_parser.add_argument(
+        "--no-contents",
+        action="store_true",
+        help="skip the per-set cache contents dump",
+    )
+    run_parser.add_argument(
+        "--cacti-table", help="CACTI-style table used to compute the AAT"
+    )
+    run_parser.add_argument("--memory-latency", type=float, default=100.0)
+    run_parser.add_argument("--bandwidth", type=float, default=None)
+    run_parser.add_argument("--mshrs", type=int, default=0)
+    run_parser.add_argument(
+        "--victim-hit-time",
+        type=float,
+        default=None,
+        help="latency of a victim cache hit, required with a victim cache",
+    )
+    run_parser.set_defaults(handler=run_command, parser=run_parser)
+
+    sweep_parser = subparsers.add_parser(
+        "sweep", help="simulate the configurations of a JSON file"
+    )
+    sweep_parser.add_argument("configs", help="JSON list of configurations")
+    sweep_parser.add_argument(
+        "--trace", help="trace file of configurations without one"
+    )
+    sweep_parser.add_argument("--workers", type=_positive_int, default=1)
+    sweep_parser.add_argument("--format", choices=["json", "csv"], default="json")
+    sweep_parser.add_argument(
+        "--precompile",
+        metavar="OUTPUT",
+        help="validate and normalize the configurations into OUTPUT without simulating",
+    )
+    sweep_parser.set_defaults(handler=sweep_command, parser=sweep_parser)
+
+    convert_parser = subparsers.add_parser(
+        "convert-trace", help="convert a trace between the text and binary format"
+    )
+    convert_parser.add_argument("input", help="trace file in the traces directory")
+    convert_parser.add_argument("output", help="output file in the traces directory")
+    convert_parser.add_argument(
+        "--to",
+        choices=["text", "binary"],
+        help="output format, binary for .bin outputs",
+    )
+    convert_parser.set_defaults(handler=convert_trace_command, parser=convert_parser)
+
+    bench_parser = subparsers.add_parser(
+        "bench", help="time the simulation of a configuration"
+    )
+    _add_config_arguments(bench_parser)
+    bench_parser.add_argument("--repeat", type=_positive_int, default=3)
+    bench_parser.set_defaults(handler=bench_command, parser=bench_parser)
+    return parser
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    # positional arguments without a subcommand keep the original usage
+    if argv and argv[0] not in SUBCOMMANDS and not argv[0].startswith("-"):
+        argv = ["run"] + list(argv)
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.handler(args.parser, args)
+
+
+if __name__ == "__main__":
+    main()
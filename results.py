@@ -0,0 +1,149 @@
+"""
+Module: results.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains the Class SimulationResults that holds the
+counters, derived rates, memory traffic and timing metrics of a simulation run and
+writes them as JSON or CSV.
+"""
+import csv
+import io
+import json
+
+# configuration keys, counters of a cache level and of the victim cache
+CONFIG_FIELDS = (
+    "block_size",
+    "L1_size",
+    "L1_assoc",
+    "L2_size",
+    "L2_assoc",
+    "replace_policy",
+    "inclusion_policy",
+    "victim_entries",
+    "trace_file",
+)
+CACHE_COUNTERS = (
+    "reads",
+    "read_hits",
+    "read_misses",
+    "writes",
+    "write_hits",
+    "write_misses",
+    "write_backs",
+    "mem_write_back",
+    "fills",
+)
+VICTIM_CACHE_COUNTERS = ("requests", "hits", "misses", "write_backs", "mem_write_back")
+TIMING_FIELDS = ("AAT", "effective_access_time", "memory_level_parallelism")
+
+# columns of every CSV row, levels absent from a configuration are left empty so that
+# the rows of different configurations line up
+CSV_COLUMNS = (
+    [f"config.{name}" for name in CONFIG_FIELDS]
+    + [f"L1.{name}" for name in CACHE_COUNTERS + ("miss_rate",)]
+    + [f"L2.{name}" for name in CACHE_COUNTERS + ("miss_rate",)]
+    + [f"victim_cache.{name}" for name in VICTIM_CACHE_COUNTERS]
+    + ["memory_traffic"]
+    + list(TIMING_FIELDS)
+)
+
+
+# returns the counters of a cache level as a dictionary
+def cache_counters(cache):
+    return {name: getattr(cache, name) for name in CACHE_COUNTERS}
+
+
+# returns the counters of a victim cache as a dictionary
+def victim_cache_counters(victimCache):
+    return {name: getattr(victimCache, name) for name in VICTIM_CACHE_COUNTERS}
+
+
+# returns a ratio, 0 when there is nothing to divide by
+def rate(count, total):
+    if total == 0:
+        return 0.0
+    return float(count) / total
+
+
+class SimulationResults:
+    def __init__(
+        self,
+        config,
+        L1,
+        L2=None,
+        victimCache=None,
+        memoryTraffic=0,
+        AAT=None,
+        latencyHistogram=None,
+        effectiveAccessTime=None,
+        memoryLevelParallelism=None,
+    ):
+        # configuration of the simulated hierarchy
+        self.config = config
+
+        # counters and derived rates of every level, None if the level is absent
+        self.L1 = L1
+        self.L2 = L2
+        self.victim_cache = victimCache
+        self.memory_traffic = memoryTraffic
+
+        # timing metrics, None if no timing model was used
+        self.AAT = AAT
+        self.latency_histogram = latencyHistogram
+        self.effective_access_time = effectiveAccessTime
+        self.memory_level_parallelism = memoryLevelParallelism
+
+    @property
+    def L1_miss_rate(self):
+        return self.L1["miss_rate"]
+
+    @property
+    def L2_miss_rate(self):
+        if self.L2 is None:
+            return 0.0
+        return self.L2["miss_rate"]
+
+    # returns the results as a nested dictionary
+    def to_dict(self):
+        output = {
+            "config": self.config,
+            "L1": self.L1,
+            "L2": self.L2,
+            "victim_cache": self.victim_cache,
+            "memory_traffic": self.memory_traffic,
+        }
+        if self.AAT is not None:
+            output["AAT"] = self.AAT
+            output["effective_access_time"] = self.effective_access_time
+            output["memory_level_parallelism"] = self.memory_level_parallelism
+            output["latency_histogram"] = {
+                str(latency): count for latency, count in self.latency_histogram.items()
+            }
+        return output
+
+    # returns the results as a JSON document
+    def to_json(self, indent=None):
+        return json.dumps(self.to_dict(), indent=indent)
+
+    # returns the results flattened to the CSV_COLUMNS "section.name" columns, without
+    # the histogram, None for the columns of absent levels and timing metrics
+    def to_row(self):
+        row = {}
+        for column in CSV_COLUMNS:
+            section, _, name = column.rpartition(".")
+            if section == "":
+                row[column] = getattr(self, name)
+            else:
+                values = getattr(self, section)
+                row[column] = None if values is None else values[name]
+        return row
+
+    # returns the results as CSV, with a header line unless header is False
+    def to_csv(self, header=True):
+        row = self.to_row()
+        output = io.StringIO()
+        writer = csv.DictWriter(output, fieldnames=CSV_COLUMNS, lineterminator="\n")
+        if header:
+            writer.writeheader()
+        writer.writerow(row)
+        return output.getvalue()
@@ -5,9 +5,17 @@ Date: November 10, 2023
 Description: This module contains the generic cache simulator code.
 """
 
-import sys
-from utils import *
 from cache import Cache
+from timing import VICTIM_CACHE_HIT
+from victim_cache import VictimCache
+from trace_reader import compress_trace, read_trace
+from results import (
+    SimulationResults,
+    cache_counters,
+    rate,
+    victim_cache_counters,
+)
+from sim_config import INCLUSION_POLICIES, REPLACEMENT_POLICIES, normalize_config
 
 
 class CacheSimulator:
@@ -21,7 +29,11 @@ class CacheSimulator:
         replace_policy,
         inclusion_policy,
         trace_file,
-        debug=False,
+        timing_model=None,
+        victim_entries=0,
+        trace=None,
+        compress=False,
+        records=None,
     ):
         self.block_size = block_size
         self.L1_size = L1_size
@@ -31,10 +43,28 @@ class CacheSimulator:
         self.replace_policy = replace_policy
         self.inclusion_policy = inclusion_policy
         self.trace_file = trace_file
-        self.debug = debug
+        self.trace = trace
+        self.compress = compress
+        self.records = records
+        self.timing_model = timing_model
+        self.victim_entries = victim_entries
 
-        self.replacement_policies = {"0": "LRU", "1": "FIFO"}
-        self.inclusion_policies = {"0": "non-inclusive", "1": "inclusive"}
+        # the timing model needs one hit time per cache level
+        levels = 1 if self.L2_size == 0 else 2
+        if timing_model is not None and len(timing_model.hit_times) != levels:
+            raise ValueError(
+                f"timing model has {len(timing_model.hit_times)} hit times, "
+                f"the hierarchy has {levels} cache levels"
+            )
+        if (
+            timing_model is not None
+            and victim_entries != 0
+            and timing_model.victim_hit_time is None
+        ):
+            raise ValueError("timing model has no victim cache hit time")
+
+        self.replacement_policies = REPLACEMENT_POLICIES
+        self.inclusion_policies = INCLUSION_POLICIES
 
         self.L1_cache = Cache(
             blockSize=self.block_size,
@@ -56,85 +86,226 @@ class CacheSimulator:
             )
             self.L1_cache.next_cache_level = self.L2_cache
 
-        with open("traces/" + self.trace_file, "r") as file:
-            traces = file.readlines()
-            for instruction in traces[:]:
-                mode, address = instruction.split(" ")
-                address = fixAddress(address)
-                L1_status = self.L1_cache.cache_request(address=address, operation=mode)
-                if L1_status == False:  # miss in L1 cache
-                    if self.L2_size == 0:
-                        self.L1_cache.allocate_block(
-                            address, mode
-                        )  # allocate block in L1
+        # optional fully-associative victim cache between L1 and L2
+        self.victim_cache = None
+        if self.victim_entries != 0:
+            self.victim_cache = VictimCache(
+                blockSize=self.block_size,
+                entries=self.victim_entries,
+                inclusionPolicy=self.inclusion_policy,
+            )
 
-                    else:
-                        if self.inclusion_policy == 0:
-                            # non-inclusive cache
-                            self.L1_cache.allocate_block(address, mode)
-
-                            if self.L1_cache.writeBack:
-                                # write back from L1 to L2
-                                L2_status = self.L2_cache.cache_request(
-                                    address=self.L1_cache.evictedAddress, operation="w"
-                                )
-                                if L2_status == False:
-                                    self.L2_cache.allocate_block(
-                                        self.L1_cache.evictedAddress, "w"
-                                    )  # pass write request to L2 with the evicted address
-
-                            # read request to L2 incase of L1 miss
-                            L2_status = self.L2_cache.cache_request(
-                                address=address, operation="r"
-                            )
-                            if L2_status == False:
-                                # L2 cache miss, allocate block in L2
-                                self.L2_cache.allocate_block(address, "r")
-
-                        else:
-                            # inclusive cache
-                            self.L1_cache.allocate_block(address, mode)
-
-                            if self.L1_cache.writeBack:
-                                # write back from L1 to L2
-                                L2_status = self.L2_cache.cache_request(
-                                    address=self.L1_cache.evictedAddress, operation="w"
-                                )
-                                if L2_status == False:
-                                    self.L2_cache.allocate_block(
-                                        self.L1_cache.evictedAddress, "w"
-                                    )
-                                    if self.L2_cache.evicted == True:
-                                        self.L1_cache.invalidate_block(
-                                            self.L2_cache.evictedAddress
-                                        )
-
-                            # read request to L2 incase of L1 miss
-                            L2_status = self.L2_cache.cache_request(
-                                address=address, operation="r"
-                            )
-                            if L2_status == False:
-                                self.L2_cache.allocate_block(address, "r")
-                                # send invalidation request to L1 cache to preserve inclusion property
-                                if self.L2_cache.evicted == True:
-                                    self.L1_cache.invalidate_block(
-                                        self.L2_cache.evictedAddress
-                                    )
-
-        if self.debug != True:
-            self.print_cache_configuration()
-            self.print_cache_contents()
-            self.print_cache_metrics()
+    # builds a simulator from a configuration dictionary
+    @classmethod
+    def from_config(
+        cls, config, trace_file, trace=None, timing_model=None, records=None
+    ):
+        config = normalize_config(config)
+        return cls(
+            block_size=config["block_size"],
+            L1_size=config["L1_size"],
+            L1_assoc=config["L1_assoc"],
+            L2_size=config["L2_size"],
+            L2_assoc=config["L2_assoc"],
+            replace_policy=config["replace_policy"],
+            inclusion_policy=config["inclusion_policy"],
+            trace_file=trace_file,
+            timing_model=timing_model,
+            victim_entries=config["victim_entries"],
+            trace=trace,
+            compress=config["compress"],
+            records=records,
+        )
+
+    # simulates the trace through the hierarchy and returns the results
+    def run(self):
+        if self.compress and self.records is not None:
+            # records compressed for this block size are shared between simulations
+            self._run_compressed(self.records)
+            return self.get_results()
+
+        # decoded (operation, address) requests, read from the trace file if not given
+        trace = self.trace
+        if trace is None:
+            trace = read_trace(self.trace_file)
+
+        if self.compress:
+            self._run_compressed(compress_trace(trace, self.block_size))
+        else:
+            for mode, address in trace:
+                level = self._process_request(address, mode)
+                if self.timing_model is not None:
+                    self.timing_model.record_access(address, level)
+
+        return self.get_results()
+
+    # simulates run-length compressed (operation, address, reads, writes) records
+    def _run_compressed(self, records):
+        for mode, address, reads, writes in records:
+            level = self._process_request(address, mode)
+            if self.timing_model is not None:
+                self.timing_model.record_access(address, level)
+
+            if reads + writes == 0:
+                continue
+            # the block is resident in L1 after its first access: L1 allocates on
+            # every miss, and write backs to an inclusive L2 always hit, so they never
+            # back-invalidate it. The repeated accesses are all L1 hits.
+            self.L1_cache.repeat_hits(reads, writes)
+            if self.timing_model is not None:
+                self.timing_model.record_repeated_hits(address, reads + writes)
+
+    # collects the counters, derived rates and memory traffic of the hierarchy
+    def get_results(self):
+        config = {
+            "block_size": self.block_size,
+            "L1_size": self.L1_size,
+            "L1_assoc": self.L1_assoc,
+            "L2_size": self.L2_size,
+            "L2_assoc": self.L2_assoc,
+            "replace_policy": self.replace_policy,
+            "inclusion_policy": self.inclusion_policy,
+            "victim_entries": self.victim_entries,
+            "trace_file": self.trace_file,
+        }
+
+        L1 = cache_counters(self.L1_cache)
+        L1["miss_rate"] = rate(
+            self.L1_cache.read_misses + self.L1_cache.write_misses,
+            self.L1_cache.reads + self.L1_cache.writes,
+        )
+        memory_traffic = (
+            self.L1_cache.read_misses
+            + self.L1_cache.write_misses
+            + self.L1_cache.write_backs
+        )
+
+        victim_cache = None
+        if self.victim_cache is not None:
+            victim_cache = victim_cache_counters(self.victim_cache)
+            # only victim cache misses and write backs reach the memory
+            memory_traffic = (
+                self.victim_cache.misses
+                + self.victim_cache.write_backs
+                + self.victim_cache.mem_write_back
+            )
+
+        L2 = None
+        if self.L2_size != 0:
+            L2 = cache_counters(self.L2_cache)
+            L2["miss_rate"] = rate(self.L2_cache.read_misses, self.L2_cache.reads)
+            memory_traffic = (
+                self.L2_cache.read_misses
+                + self.L2_cache.write_misses
+                + self.L2_cache.write_backs
+                + self.L1_cache.mem_write_back
+            )
+            if self.victim_cache is not None:
+                memory_traffic += self.victim_cache.mem_write_back
+
+        AAT = None
+        latency_histogram = None
+        effective_access_time = None
+        memory_level_parallelism = None
+        if self.timing_model is not None:
+            AAT = self.timing_model.average_access_time()
+            latency_histogram = self.timing_model.latency_histogram()
+            effective_access_time = self.timing_model.effective_access_time()
+            memory_level_parallelism = self.timing_model.memory_level_parallelism()
+
+        return SimulationResults(
+            config,
+            L1,
+            L2=L2,
+            victimCache=victim_cache,
+            memoryTraffic=memory_traffic,
+            AAT=AAT,
+            latencyHistogram=latency_histogram,
+            effectiveAccessTime=effective_access_time,
+            memoryLevelParallelism=memory_level_parallelism,
+        )
+
+    # invalidates a block in L1 and the victim cache to preserve inclusion property
+    def _back_invalidate(self, address):
+        self.L1_cache.invalidate_block(address)
+        if self.victim_cache is not None:
+            self.victim_cache.invalidate_block(address)
+
+    # writes a block evicted from L1 (or the victim cache) to L2
+    def _write_back_to_L2(self, address, dirty):
+        if self.inclusion_policy == "2":
+            # exclusive cache, L2 is filled only by evictions
+            self.L2_cache.fill_block(address, dirty)
+            return
+
+        if dirty:
+            L2_status = self.L2_cache.cache_request(address=address, operation="w")
+            if L2_status == False:
+                # pass write request to L2 with the evicted address
+                self.L2_cache.allocate_block(address, "w")
+                if self.L2_cache.evicted == True:
+                    self._back_invalidate(self.L2_cache.evictedAddress)
+
+    # moves the block evicted from L1 down the hierarchy
+    def _handle_L1_eviction(self):
+        if self.L1_cache.evicted == False:
+            return
+        address = self.L1_cache.evictedAddress
+        dirty = self.L1_cache.evictedDirty
+
+        if self.victim_cache is not None:
+            self.victim_cache.insert_block(address, dirty)
+            if self.victim_cache.evicted == False:
+                return
+            address = self.victim_cache.evictedAddress
+            dirty = self.victim_cache.evictedDirty
+
+        if self.L2_size != 0:
+            self._write_back_to_L2(address, dirty)
+
+    # processes a request through the hierarchy, returns the level that serviced it
+    # (1 for L1, 2 for L2, and the level after the last cache for main memory)
+    def _process_request(self, address, mode):
+        L1_status = self.L1_cache.cache_request(address=address, operation=mode)
+        if L1_status == True:
+            return 1
+
+        # miss in L1 cache, the victim cache is probed alongside L1
+        if self.victim_cache is not None and self.victim_cache.cache_request(address):
+            # swap the block in the victim cache with the L1 victim
+            dirty = self.victim_cache.remove_block(address)
+            self.L1_cache.allocate_block(address, "w" if dirty else mode)
+            self._handle_L1_eviction()
+            return VICTIM_CACHE_HIT
+
+        if self.L2_size == 0:
+            self.L1_cache.allocate_block(address, mode)  # allocate block in L1
+            self._handle_L1_eviction()
+            return 2
+
+        if self.inclusion_policy == "2":
+            # exclusive cache, the block moves from L2 to L1 on a hit
+            L2_status = self.L2_cache.cache_request(address=address, operation="r")
+            dirty = L2_status and self.L2_cache.remove_block(address)
+            self.L1_cache.allocate_block(address, "w" if dirty else mode)
+            self._handle_L1_eviction()
 
         else:
-            # used for evaluating benchmark metrics
-            self.L1_miss_rate = (
-                float(self.L1_cache.read_misses + self.L1_cache.write_misses)
-            ) / (self.L1_cache.reads + self.L1_cache.writes)
-            if self.L2_size != 0:
-                self.L2_miss_rate = (float(self.L2_cache.read_misses)) / (
-                    self.L2_cache.reads
-                )
+            # non-inclusive and inclusive cache
+            self.L1_cache.allocate_block(address, mode)
+            self._handle_L1_eviction()
+
+            # read request to L2 incase of L1 miss
+            L2_status = self.L2_cache.cache_request(address=address, operation="r")
+            if L2_status == False:
+                self.L2_cache.allocate_block(address, "r")
+                # send invalidation request to L1 cache to preserve inclusion property
+                if self.L2_cache.evicted == True:
+                    self._back_invalidate(self.L2_cache.evictedAddress)
+
+        if L2_status == True:
+            return 2
+        return 3
 
     def print_cache_configuration(self):
         print("===== Simulator configuration =====")
@@ -150,6 +321,8 @@ class CacheSimulator:
             "INCLUSION PROPERTY:    " + self.inclusion_policies[self.inclusion_policy]
         )
         print("trace_file:            " + self.trace_file)
+        if self.victim_cache is not None:
+            print("VICTIM_CACHE_ENTRIES:  " + str(self.victim_entries))
 
     def print_cache_contents(self):
         print("===== L1 contents =====")
@@ -174,67 +347,57 @@ class CacheSimulator:
                         print("   ", end="")
                 print()
 
-    def print_cache_metrics(self):
+    def print_cache_metrics(self, results):
+        L1 = results.L1
         print("===== Simulation results (raw) =====")
-        print(f"a. number of L1 reads:        {self.L1_cache.reads}")
-        print(f"b. number of L1 read misses:  {self.L1_cache.read_misses}")
-        print(f"c. number of L1 writes:       {self.L1_cache.writes}")
-        print(f"d. number of L1 write misses: {self.L1_cache.write_misses}")
-        self.L1_miss_rate = (
-            float(self.L1_cache.read_misses + self.L1_cache.write_misses)
-        ) / (self.L1_cache.reads + self.L1_cache.writes)
-        print(f"e. L1 miss rate:              {self.L1_miss_rate:6f}")
-        print(f"f. number of L1 writebacks:   {self.L1_cache.write_backs}")
-        self.L1_mem_traffic = (
-            self.L1_cache.read_misses
-            + self.L1_cache.write_misses
-            + self.L1_cache.write_backs
-        )
-        if self.L2_size == 0:
+        print(f"a. number of L1 reads:        {L1['reads']}")
+        print(f"b. number of L1 read misses:  {L1['read_misses']}")
+        print(f"c. number of L1 writes:       {L1['writes']}")
+        print(f"d. number of L1 write misses: {L1['write_misses']}")
+        print(f"e. L1 miss rate:              {L1['miss_rate']:6f}")
+        print(f"f. number of L1 writebacks:   {L1['write_backs']}")
+        if results.L2 is None:
             print(f"g. number of L2 reads:        0")
             print(f"h. number of L2 read misses:  0")
             print(f"i. number of L2 writes:       0")
             print(f"j. number of L2 write misses: 0")
             print(f"k. L2 miss rate:              0")
             print(f"l. number of L2 writebacks:   0")
-            print(f"m. total memory traffic:      {self.L1_mem_traffic}")
         else:
-            self.L2_miss_rate = (float(self.L2_cache.read_misses)) / (
-                self.L2_cache.reads
-            )
-            self.L2_mem_traffic = (
-                self.L2_cache.read_misses
-                + self.L2_cache.write_misses
-                + self.L2_cache.write_backs
-                + self.L1_cache.mem_write_back
+            L2 = results.L2
+            print(f"g. number of L2 reads:        {L2['reads']}")
+            print(f"h. number of L2 read misses:  {L2['read_misses']}")
+            print(f"i. number of L2 writes:       {L2['writes']}")
+            print(f"j. number of L2 write misses: {L2['write_misses']}")
+            print(f"k. L2 miss rate:              {L2['miss_rate']:6f}")
+            print(f"l. number of L2 writebacks:   {L2['write_backs']}")
+        print(f"m. total memory traffic:      {results.memory_traffic}")
+        if results.victim_cache is not None:
+            victim_cache = results.victim_cache
+            print(f"n. number of victim cache hits:       {victim_cache['hits']}")
+            print(
+                f"o. number of victim cache writebacks: {victim_cache['write_backs']}"
             )
+        if results.L2 is not None and self.inclusion_policy == "2":
+            print(f"p. number of L2 fills:        {results.L2['fills']}")
 
-            print(f"g. number of L2 reads:        {self.L2_cache.reads}")
-            print(f"h. number of L2 read misses:  {self.L2_cache.read_misses}")
-            print(f"i. number of L2 writes:       {self.L2_cache.writes}")
-            print(f"j. number of L2 write misses: {self.L2_cache.write_misses}")
-            print(f"k. L2 miss rate:              {self.L2_miss_rate:6f}")
-            print(f"l. number of L2 writebacks:   {self.L2_cache.write_backs}")
-            print(f"m. total memory traffic:      {self.L2_mem_traffic}")
+    # prints the results in the given output format
+    def print_results(self, results, output_format="text", contents=True):
+        if output_format == "json":
+            print(results.to_json(indent=2))
+        elif output_format == "csv":
+            print(results.to_csv(), end="")
+        else:
+            self.print_cache_configuration()
+            if contents:
+                # the per-set dump is expensive for large caches
+                self.print_cache_contents()
+            self.print_cache_metrics(results)
+            if self.timing_model is not None:
+                self.timing_model.print_timing_metrics()
 
 
 if __name__ == "__main__":
-    block_size = int(sys.argv[1])
-    L1_size = int(sys.argv[2])
-    L1_assoc = int(sys.argv[3])
-    L2_size = int(sys.argv[4])
-    L2_assoc = int(sys.argv[5])
-    replace_policy = sys.argv[6]
-    inclusion_policy = sys.argv[7]
-    trace_file = sys.argv[8]
-
-    cacheSimulator = CacheSimulator(
-        block_size,
-        L1_size,
-        L1_assoc,
-        L2_size,
-        L2_assoc,
-        replace_policy,
-        inclusion_policy,
-        trace_file,
-    )
+    from cli import main
+
+    main()
@@ -0,0 +1,124 @@
+"""
+Module: sim_config.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains the simulator configuration defaults, their
+normalization and validation, kept free of heavy imports so that invalid configurations
+fail fast.
+"""
+
+# keys every configuration must give
+REQUIRED_KEYS = ("block_size", "L1_size", "L1_assoc")
+
+# defaults of the optional keys, overridden by the given configuration
+DEFAULT_CONFIG = {
+    "L2_size": 0,
+    "L2_assoc": 0,
+    "replace_policy": "0",
+    "inclusion_policy": "0",
+    "victim_entries": 0,
+    "compress": False,
+}
+
+INTEGER_KEYS = (
+    "block_size",
+    "L1_size",
+    "L1_assoc",
+    "L2_size",
+    "L2_assoc",
+    "victim_entries",
+)
+
+REPLACEMENT_POLICIES = {"0": "LRU", "1": "FIFO"}
+INCLUSION_POLICIES = {"0": "non-inclusive", "1": "inclusive", "2": "exclusive"}
+
+
+# returns True if the value is a positive power of two
+def is_power_of_two(value):
+    return value > 0 and value & (value - 1) == 0
+
+
+# returns the configuration with defaults filled in and policies converted to strings,
+# raises a ValueError listing unknown or missing keys and values of the wrong type
+def normalize_config(config):
+    errors = []
+    for key in config:
+        if key not in DEFAULT_CONFIG and key not in REQUIRED_KEYS:
+            errors.append(f"unknown key {key!r}")
+    for key in REQUIRED_KEYS:
+        if key not in config:
+            errors.append(f"missing key {key!r}")
+    output = {key: config[key] for key in REQUIRED_KEYS if key in config}
+    output.update(DEFAULT_CONFIG)
+    output.update(config)
+
+    # bool is a subclass of int, but True is no size
+    for key in INTEGER_KEYS:
+        value = output.get(key)
+        if key in output and (not isinstance(value, int) or isinstance(value, bool)):
+            errors.append(f"{key} must be an integer, got {value!r}")
+    for key in ("replace_policy", "inclusion_policy"):
+        value = output[key]
+        if isinstance(value, int) and not isinstance(value, bool):
+            output[key] = str(value)
+        elif not isinstance(value, str):
+            errors.append(f"{key} must be a string, got {value!r}")
+    if not isinstance(output["compress"], bool):
+        errors.append(f"compress must be true or false, got {output['compress']!r}")
+    if errors:
+        raise ValueError("; ".join(errors))
+    return output
+
+
+# returns the errors of a cache level configuration
+def _validate_level(name, block_size, size, assoc):
+    errors = []
+    if not is_power_of_two(size):
+        errors.append(f"{name}_SIZE must be a power of two, got {size}")
+    elif size < block_size:
+        errors.append(f"{name}_SIZE {size} is smaller than BLOCKSIZE {block_size}")
+    if assoc < 0:
+        errors.append(
+            f"{name}_ASSOC must be 0 (fully-associative) or positive, got {assoc}"
+        )
+    elif errors == [] and assoc != 0:
+        sets = size / float(block_size * assoc)
+        if sets < 1 or sets != int(sets) or not is_power_of_two(int(sets)):
+            errors.append(
+                f"{name} with SIZE {size}, ASSOC {assoc} and BLOCKSIZE {block_size} "
+                f"gives {sets:g} sets, the number of sets must be a power of two"
+            )
+    return errors
+
+
+# returns the list of errors of a normalized configuration, empty if it is valid
+def validate_config(config):
+    errors = []
+    block_size = config["block_size"]
+    if not is_power_of_two(block_size):
+        errors.append(f"BLOCKSIZE must be a power of two, got {block_size}")
+        return errors
+
+    errors += _validate_level("L1", block_size, config["L1_size"], config["L1_assoc"])
+    if config["L2_size"] != 0:
+        errors += _validate_level(
+            "L2", block_size, config["L2_size"], config["L2_assoc"]
+        )
+    if config["replace_policy"] not in REPLACEMENT_POLICIES:
+        errors.append(
+            f"REPLACEMENT_POLICY must be one of {sorted(REPLACEMENT_POLICIES)}, "
+            f"got {config['replace_policy']!r}"
+        )
+    if config["inclusion_policy"] not in INCLUSION_POLICIES:
+        errors.append(
+            f"INCLUSION_PROPERTY must be one of {sorted(INCLUSION_POLICIES)}, "
+            f"got {config['inclusion_policy']!r}"
+        )
+    if config["inclusion_policy"] == "2" and config["L2_size"] == 0:
+        errors.append("INCLUSION_PROPERTY 2 (exclusive) requires an L2 cache")
+    if config["victim_entries"] < 0:
+        errors.append(
+            "VICTIM_CACHE_ENTRIES must be 0 or positive, "
+            f"got {config['victim_entries']}"
+        )
+    return errors
@@ -0,0 +1,294 @@
+"""
+Module: sim_service.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains a long-running simulation service that runs
+cache simulation jobs on a pool of warm worker processes. Every worker keeps the traces
+it has decoded resident, keyed by path and version, so a job sends only its
+configuration and the trace name.
+
+The service listens on a Unix socket or a localhost TCP port and speaks
+newline-delimited JSON, one response line per request line:
+
+    {"op": "load_trace", "name": "gcc_trace.txt"}
+    {"op": "trace_chunk", "name": "my_trace", "data": "r 1a2b3c4d\\nw 1a2b3c50\\n"}
+    {"op": "trace_end", "name": "my_trace"}
+    {"op": "run", "trace": "gcc_trace.txt", "config": {"block_size": 16, ...}}
+    {"op": "list_traces"}
+    {"op": "drop_trace", "name": "my_trace"}
+"""
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from sim_cache import CacheSimulator
+from sim_config import normalize_config, validate_config
+from trace_reader import (
+    check_trace_name,
+    compress_trace,
+    encode_binary_trace,
+    parse_trace_lines,
+    read_trace_file,
+)
+
+# traces decoded by this worker process, trace path -> (version, requests), and their
+# run-length compressed records, (trace path, block size) -> (version, records)
+_resident_traces = {}
+_resident_records = {}
+
+
+# returns the decoded requests of a trace, decoding it only if this worker does not hold
+# its version yet
+def _resident_trace(path, version):
+    entry = _resident_traces.get(path)
+    if entry is None or entry[0] != version:
+        # streamed traces that were dropped or replaced no longer have a file
+        for resident_path in list(_resident_traces):
+            if not os.path.exists(resident_path):
+                del _resident_traces[resident_path]
+        for key in list(_resident_records):
+            if key[0] not in _resident_traces:
+                del _resident_records[key]
+        entry = (version, read_trace_file(path))
+        _resident_traces[path] = entry
+    return entry[1]
+
+
+# decodes a trace in a worker process and returns its number of requests
+def load_job(path, version):
+    return len(_resident_trace(path, version))
+
+
+# returns the run-length compressed records of a trace, compressing it only if this
+# worker does not hold them for its version and block size yet
+def _resident_records_of(path, version, block_size):
+    trace = _resident_trace(path, version)
+    entry = _resident_records.get((path, block_size))
+    if entry is None or entry[0] != version:
+        entry = (version, compress_trace(trace, block_size))
+        _resident_records[(path, block_size)] = entry
+    return entry[1]
+
+
+# runs a simulation job in a worker process and returns its results as a dictionary
+def run_job(config, trace_name, path, version):
+    if config["compress"]:
+        records = _resident_records_of(path, version, config["block_size"])
+        cacheSimulator = CacheSimulator.from_config(config, trace_name, records=records)
+    else:
+        trace = _resident_trace(path, version)
+        cacheSimulator = CacheSimulator.from_config(config, trace_name, trace=trace)
+    return cacheSimulator.run().to_dict()
+
+
+# writes a streamed trace as a binary trace that the workers can read
+def _write_spool(path, trace):
+    with open(path, "wb") as file:
+        file.write(encode_binary_trace(trace))
+
+
+class SimulationService:
+    def __init__(self, workers=None):
+        self.executor = ProcessPoolExecutor(max_workers=workers)
+
+        # streamed traces are spooled to this directory, one file per upload
+        self.spool = tempfile.TemporaryDirectory(prefix="sim_service_")
+        self.uploads = 0
+
+        # traces available to jobs, name -> (path, version, number of requests), and
+        # traces being streamed, name -> (partial last line, lines parsed, requests,
+        # owning connection)
+        self.traces = {}
+        self.pending = {}
+
+        # a lock per streamed trace name, the number of jobs in flight per spool file
+        # and the spool files of replaced or dropped traces that jobs still read
+        self.stream_locks = {}
+        self.jobs = {}
+        self.retired = set()
+
+    # decodes a trace file from the traces directory on a worker, again only if it
+    # changed
+    async def _load_trace(self, request):
+        name = request["name"]
+        check_trace_name(name)
+        path = "traces/" + name
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"trace file {path} does not exist")
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        entry = self.traces.get(name)
+        if entry is None or entry[:2] != (path, version):
+            loop = asyncio.get_running_loop()
+            requests = await loop.run_in_executor(
+                self.executor, load_job, path, version
+            )
+            self._replace_trace(name, (path, version, requests))
+        return {"name": name, "requests": self.traces[name][2]}
+
+    # makes a trace available to jobs, removing the spool file of the trace it replaces
+    # once no job in flight reads it
+    def _replace_trace(self, name, entry):
+        previous = self.traces.get(name)
+        if previous is not None and previous[0].startswith(self.spool.name):
+            if self.jobs.get(previous[0], 0) > 0:
+                self.retired.add(previous[0])
+            else:
+                os.remove(previous[0])
+        if entry is None:
+            self.traces.pop(name, None)
+        else:
+            self.traces[name] = entry
+
+    # returns the pending state of a streamed trace, raises a ValueError if another
+    # connection is streaming it
+    def _pending_stream(self, name, client):
+        entry = self.pending.get(name)
+        if entry is None:
+            return "", 0, []
+        if entry[3] is not client:
+            raise ValueError(f"trace {name!r} is being streamed by another connection")
+        return entry[:3]
+
+    # decodes a streamed chunk of a trace, a line split across chunks is kept pending
+    # and the pending state is only updated once the chunk decoded without errors
+    async def _trace_chunk(self, request, client=None):
+        name = request["name"]
+        check_trace_name(name)
+        async with self.stream_locks.setdefault(name, asyncio.Lock()):
+            buffered, parsed, trace = self._pending_stream(name, client)
+            lines = (buffered + request["data"]).split("\n")
+            loop = asyncio.get_running_loop()
+            requests = await loop.run_in_executor(
+                None, parse_trace_lines, lines[:-1], parsed + 1
+            )
+            trace.extend(requests)
+            self.pending[name] = (lines[-1], parsed + len(lines) - 1, trace, client)
+        return {"name": name, "requests": len(trace)}
+
+    # finishes a streamed trace, spools it and makes it available to jobs
+    async def _trace_end(self, request, client=None):
+        name = request["name"]
+        check_trace_name(name)
+        async with self.stream_locks.setdefault(name, asyncio.Lock()):
+            buffered, parsed, trace = self._pending_stream(name, client)
+            loop = asyncio.get_running_loop()
+            requests = await loop.run_in_executor(
+                None, parse_trace_lines, [buffered], parsed + 1
+            )
+            trace.extend(requests)
+            self.pending.pop(name, None)
+
+            self.uploads += 1
+            path = os.path.join(self.spool.name, f"{self.uploads}_{name}")
+            await loop.run_in_executor(None, _write_spool, path, trace)
+            self._replace_trace(name, (path, self.uploads, len(trace)))
+        return {"name": name, "requests": len(trace)}
+
+    # schedules a simulation job on the worker pool, the spool file of a streamed trace
+    # is kept until the job finished
+    async def _run(self, request):
+        name = request["trace"]
+        config = normalize_config(request.get("config", {}))
+        errors = validate_config(config)
+        if errors:
+            raise ValueError("; ".join(errors))
+        entry = self.traces.get(name)
+        if entry is None or not entry[0].startswith(self.spool.name):
+            await self._load_trace({"name": name})
+        path, version, _ = self.traces[name]
+        self.jobs[path] = self.jobs.get(path, 0) + 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self.executor, run_job, config, name, path, version
+            )
+        finally:
+            self.jobs[path] -= 1
+            if self.jobs[path] == 0:
+                del self.jobs[path]
+                if path in self.retired:
+                    self.retired.remove(path)
+                    os.remove(path)
+
+    # dispatches a request of a client connection and returns the response
+    async def handle_request(self, request, client=None):
+        op = request.get("op")
+        if op == "run":
+            return await self._run(request)
+        elif op == "load_trace":
+            return await self._load_trace(request)
+        elif op == "trace_chunk":
+            return await self._trace_chunk(request, client)
+        elif op == "trace_end":
+            return await self._trace_end(request, client)
+        elif op == "list_traces":
+            return {name: entry[2] for name, entry in self.traces.items()}
+        elif op == "drop_trace":
+            self._replace_trace(request["name"], None)
+            self.pending.pop(request["name"], None)
+            return {"name": request["name"]}
+        else:
+            raise ValueError(f"unknown op {op!r}")
+
+    # serves the requests of one client connection, the traces it was still streaming
+    # are discarded when it disconnects
+    async def handle_client(self, reader, writer):
+        client = object()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    result = await self.handle_request(json.loads(line), client)
+                    response = {"ok": True, "result": result}
+                except Exception as error:
+                    response = {
+                        "ok": False,
+                        "error": f"{type(error).__name__}: {error}",
+                    }
+                writer.write((json.dumps(response) + "\n").encode())
+                await writer.drain()
+        finally:
+            for name, entry in list(self.pending.items()):
+                if entry[3] is client:
+                    del self.pending[name]
+            writer.close()
+
+    # starts listening on a Unix socket or a localhost TCP port
+    async def serve(self, unix_path=None, host="127.0.0.1", port=8765):
+        if unix_path is not None:
+            server = await asyncio.start_unix_server(
+                self.handle_client, path=unix_path, limit=2**26
+            )
+        else:
+            server = await asyncio.start_server(
+                self.handle_client, host=host, port=port, limit=2**26
+            )
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            self.close()
+
+    # stops the workers and removes the spooled traces
+    def close(self):
+        self.executor.shutdown()
+        self.spool.cleanup()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="long-running cache simulation service"
+    )
+    parser.add_argument("--unix", help="path of the Unix socket to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="localhost TCP port")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    service = SimulationService(workers=args.workers)
+    asyncio.run(service.serve(unix_path=args.unix, port=args.port))
@@ -0,0 +1,79 @@
+"""
+Module: test_compression.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module checks that simulating a run-length compressed trace
+gives the same results as simulating the trace access by access.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sim_cache import CacheSimulator  # noqa: E402
+from timing import TimingModel  # noqa: E402
+from trace_reader import compress_trace, read_trace_file  # noqa: E402
+
+# a prefix of the bundled trace keeps every configuration fast
+TRACE = read_trace_file(os.path.join(ROOT, "traces", "gcc_trace.txt"))[:20000]
+
+# timing metrics are sums of floats accumulated in a different order
+TIMING_KEYS = ("AAT", "effective_access_time", "memory_level_parallelism")
+
+
+# simulates the trace with or without compression and returns the results dictionary
+def simulate(inclusion_policy, replace_policy, victim_entries, mshrs, compress):
+    timing_model = TimingModel(
+        [1.0, 4.0],
+        16,
+        memoryLatency=100.0,
+        bandwidth=8.0,
+        mshrs=mshrs,
+        victimHitTime=1.0 if victim_entries else None,
+    )
+    cacheSimulator = CacheSimulator(
+        16,
+        512,
+        2,
+        4096,
+        4,
+        replace_policy,
+        inclusion_policy,
+        "gcc_trace.txt",
+        timing_model=timing_model,
+        victim_entries=victim_entries,
+        trace=TRACE,
+        compress=compress,
+    )
+    return cacheSimulator.run().to_dict()
+
+
+@pytest.mark.parametrize("mshrs", [0, 4])
+@pytest.mark.parametrize("victim_entries", [0, 4])
+@pytest.mark.parametrize("replace_policy", ["0", "1"])
+@pytest.mark.parametrize("inclusion_policy", ["0", "1", "2"])
+def test_compressed_matches_uncompressed(
+    inclusion_policy, replace_policy, victim_entries, mshrs
+):
+    expected = simulate(inclusion_policy, replace_policy, victim_entries, mshrs, False)
+    actual = simulate(inclusion_policy, replace_policy, victim_entries, mshrs, True)
+
+    for key in TIMING_KEYS:
+        assert actual.pop(key) == pytest.approx(expected.pop(key))
+    assert actual == expected
+
+
+def test_shared_records_match_trace():
+    records = compress_trace(TRACE, 16)
+    assert len(records) < len(TRACE)
+
+    from_records = CacheSimulator(
+        16, 512, 2, 4096, 4, "0", "0", "gcc_trace.txt", compress=True, records=records
+    ).run()
+    from_trace = CacheSimulator(
+        16, 512, 2, 4096, 4, "0", "0", "gcc_trace.txt", trace=TRACE, compress=True
+    ).run()
+    assert from_records.to_dict() == from_trace.to_dict()
@@ -0,0 +1,95 @@
+"""
+Module: test_config.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module checks the normalization of configurations and the validation
+of sweep documents and counts on the command line.
+"""
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import cli  # noqa: E402
+from sim_config import normalize_config  # noqa: E402
+
+CONFIG = {"block_size": 16, "L1_size": 1024, "L1_assoc": 2}
+
+
+def test_defaults_and_key_order():
+    config = normalize_config(dict(CONFIG, replace_policy=1, compress=True))
+    assert list(config) == [
+        "block_size",
+        "L1_size",
+        "L1_assoc",
+        "L2_size",
+        "L2_assoc",
+        "replace_policy",
+        "inclusion_policy",
+        "victim_entries",
+        "compress",
+    ]
+    assert config["replace_policy"] == "1"
+    assert config["compress"] is True
+    assert config["L2_size"] == 0
+
+
+@pytest.mark.parametrize(
+    "config, error",
+    [
+        (dict(CONFIG, L2size=8192), "unknown key 'L2size'"),
+        ({"block_size": 16, "L1_assoc": 2}, "missing key 'L1_size'"),
+        (dict(CONFIG, compress="false"), "compress must be true or false"),
+        (dict(CONFIG, compress=0), "compress must be true or false"),
+        (dict(CONFIG, L1_size="1024"), "L1_size must be an integer"),
+        (dict(CONFIG, L1_assoc=2.5), "L1_assoc must be an integer"),
+        (dict(CONFIG, victim_entries=True), "victim_entries must be an integer"),
+        (dict(CONFIG, inclusion_policy=None), "inclusion_policy must be a string"),
+    ],
+)
+def test_normalize_rejects(config, error):
+    with pytest.raises(ValueError, match=error):
+        normalize_config(config)
+
+
+# runs the command line from the repository root and returns the exit code
+def run_cli(monkeypatch, *argv):
+    monkeypatch.chdir(ROOT)
+    with pytest.raises(SystemExit) as exit_info:
+        cli.main(list(argv))
+    return exit_info.value.code
+
+
+def test_edited_precompiled_sweep_is_validated(monkeypatch, tmp_path, capsys):
+    document = tmp_path / "sweep.json"
+    document.write_text(json.dumps([CONFIG]))
+    precompiled = tmp_path / "precompiled.json"
+    monkeypatch.chdir(ROOT)
+    cli.main(
+        ["sweep", str(document), "--trace", "gcc_trace.txt"]
+        + ["--precompile", str(precompiled)]
+    )
+
+    edited = json.loads(precompiled.read_text())
+    assert edited["configs"][0]["trace_file"] == "gcc_trace.txt"
+    edited["configs"][0]["L1_size"] = 1000
+    precompiled.write_text(json.dumps(edited))
+    assert run_cli(monkeypatch, "sweep", str(precompiled)) == 2
+    assert "L1_SIZE must be a power of two" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["bench", "16", "1024", "2", "0", "0", "0", "0", "gcc_trace.txt"]
+        + ["--repeat", "0"],
+        ["sweep", "configs.json", "--workers", "0"],
+    ],
+)
+def test_counts_must_be_positive(monkeypatch, capsys, argv):
+    assert run_cli(monkeypatch, *argv) == 2
+    assert "must be at least 1" in capsys.readouterr().err
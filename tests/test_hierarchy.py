@@ -0,0 +1,128 @@
+"""
+Module: test_hierarchy.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module checks the invariants of the inclusion policies and the victim
+cache while a trace is simulated, and the counters of small hand-built traces.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sim_cache import CacheSimulator  # noqa: E402
+from trace_reader import read_trace_file  # noqa: E402
+
+TRACE = read_trace_file(os.path.join(ROOT, "traces", "gcc_trace.txt"))[:5000]
+
+
+# returns the block addresses resident in a cache level
+def cache_blocks(cache):
+    return {
+        int(block.address, 16) // cache.block_size
+        for row in cache.cacheLines
+        for block in row
+        if block.validity
+    }
+
+
+# returns the block addresses resident in the victim cache
+def victim_blocks(victimCache):
+    return set(victimCache.blocks)
+
+
+# checks that the tag index of every set maps exactly the tags of its valid ways
+def check_tag_index(cache):
+    for index, row in enumerate(cache.cacheLines):
+        valid = {block.tag: way for way, block in enumerate(row) if block.validity}
+        assert cache.tagIndex[index] == valid
+
+
+# simulates a small hierarchy request by request and checks the invariants after each
+@pytest.mark.parametrize("victim_entries", [0, 4])
+@pytest.mark.parametrize("replace_policy", ["0", "1"])
+@pytest.mark.parametrize("inclusion_policy", ["0", "1", "2"])
+def test_hierarchy_invariants(inclusion_policy, replace_policy, victim_entries):
+    cacheSimulator = CacheSimulator(
+        16,
+        256,
+        2,
+        1024,
+        4,
+        replace_policy,
+        inclusion_policy,
+        "gcc_trace.txt",
+        victim_entries=victim_entries,
+        trace=TRACE,
+    )
+    L1 = cacheSimulator.L1_cache
+    L2 = cacheSimulator.L2_cache
+    victimCache = cacheSimulator.victim_cache
+
+    for mode, address in TRACE:
+        cacheSimulator._process_request(address, mode)
+
+        check_tag_index(L1)
+        check_tag_index(L2)
+        L1_blocks = cache_blocks(L1)
+        L2_blocks = cache_blocks(L2)
+        victim = victim_blocks(victimCache) if victimCache is not None else set()
+
+        # the requested block is resident in L1 after its access
+        assert int(address, 16) // 16 in L1_blocks
+        if inclusion_policy == "2":
+            assert L1_blocks.isdisjoint(L2_blocks)
+            assert victim.isdisjoint(L2_blocks)
+            assert victim.isdisjoint(L1_blocks)
+        elif inclusion_policy == "1":
+            assert L1_blocks <= L2_blocks
+            assert victim <= L2_blocks
+
+
+def test_victim_cache_counters():
+    # A, B, C and D map to set 0 of a direct-mapped L1 with two sets
+    trace = [
+        ("r", "00000000"),  # A misses
+        ("r", "00000020"),  # B misses, A moves to the victim cache
+        ("r", "00000000"),  # A hits in the victim cache and swaps with B
+        ("r", "00000020"),  # B hits in the victim cache and swaps with A
+        ("w", "00000040"),  # C misses, B replaces A in the victim cache
+        ("r", "00000000"),  # A misses, dirty C replaces B in the victim cache
+        ("r", "00000060"),  # D misses, A replaces C, which is written back
+    ]
+    results = CacheSimulator(
+        16, 32, 1, 0, 0, "0", "0", "t", victim_entries=1, trace=trace
+    ).run()
+
+    assert results.victim_cache["requests"] == 7
+    assert results.victim_cache["hits"] == 2
+    assert results.victim_cache["misses"] == 5
+    assert results.victim_cache["write_backs"] == 1
+    # victim cache misses are read from memory, its write backs go to memory
+    assert results.memory_traffic == 6
+
+
+def test_exclusive_fills():
+    # a single block L1 in front of a fully-associative L2 with four blocks
+    trace = [
+        ("r", "00000000"),  # A misses in L1 and L2
+        ("r", "00000010"),  # B misses in both, A is filled into L2
+        ("r", "00000000"),  # A moves from L2 to L1, B is filled into L2
+        ("w", "00000010"),  # B moves from L2 to L1, A is filled into L2
+        ("r", "00000020"),  # C misses in both, dirty B is filled into L2
+    ]
+    cacheSimulator = CacheSimulator(16, 16, 1, 64, 0, "0", "2", "t", trace=trace)
+    results = cacheSimulator.run()
+
+    assert results.L2["fills"] == 4
+    assert results.L2["reads"] == 5
+    assert results.L2["read_hits"] == 2
+    assert results.L2["read_misses"] == 3
+    assert results.L2["write_backs"] == 0
+    # only the L2 misses reach the memory, dirty B is still held by L2
+    assert results.memory_traffic == 3
+    assert cache_blocks(cacheSimulator.L2_cache) == {0, 1}
+    assert cache_blocks(cacheSimulator.L1_cache) == {2}
@@ -0,0 +1,92 @@
+"""
+Module: test_results.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module checks that the JSON and CSV forms of the simulation results
+round-trip, and that CSV rows share one set of columns across configurations.
+"""
+import csv
+import io
+import json
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from results import CSV_COLUMNS  # noqa: E402
+from sim_cache import CacheSimulator  # noqa: E402
+from timing import TimingModel  # noqa: E402
+from trace_reader import read_trace_file  # noqa: E402
+
+TRACE = read_trace_file(os.path.join(ROOT, "traces", "gcc_trace.txt"))[:5000]
+
+# L1 only, L1 and L2, L1 with a victim cache and L2 with a timing model
+CONFIGURATIONS = [
+    (16, 1024, 2, 0, 0, 0, None),
+    (16, 1024, 2, 8192, 4, 0, None),
+    (32, 1024, 4, 16384, 8, 4, [0.5, 2.0]),
+]
+
+
+# simulates one of the configurations
+def simulate(block_size, L1_size, L1_assoc, L2_size, L2_assoc, victims, hit_times):
+    timing_model = None
+    if hit_times is not None:
+        timing_model = TimingModel(hit_times, block_size, victimHitTime=0.25)
+    return CacheSimulator(
+        block_size,
+        L1_size,
+        L1_assoc,
+        L2_size,
+        L2_assoc,
+        "0",
+        "0",
+        "gcc_trace.txt",
+        timing_model=timing_model,
+        victim_entries=victims,
+        trace=TRACE,
+    ).run()
+
+
+@pytest.mark.parametrize("configuration", CONFIGURATIONS)
+def test_json_round_trip(configuration):
+    results = simulate(*configuration)
+    document = json.loads(results.to_json())
+    expected = results.to_dict()
+    if "latency_histogram" in expected:
+        assert sum(document["latency_histogram"].values()) == len(TRACE)
+    assert document == json.loads(json.dumps(expected))
+    assert document["L1"] == results.L1
+    assert document["L2"] == results.L2
+    assert document["victim_cache"] == results.victim_cache
+
+
+@pytest.mark.parametrize("configuration", CONFIGURATIONS)
+def test_csv_round_trip(configuration):
+    results = simulate(*configuration)
+    rows = list(csv.DictReader(io.StringIO(results.to_csv())))
+    assert len(rows) == 1
+    assert list(rows[0]) == CSV_COLUMNS
+    for column, value in results.to_row().items():
+        assert rows[0][column] == ("" if value is None else str(value))
+
+
+def test_csv_rows_share_columns():
+    output = "".join(
+        simulate(*configuration).to_csv(header=i == 0)
+        for i, configuration in enumerate(CONFIGURATIONS)
+    )
+    lines = output.splitlines()
+    assert len(lines) == 1 + len(CONFIGURATIONS)
+    assert {len(next(csv.reader([line]))) for line in lines} == {len(CSV_COLUMNS)}
+
+    rows = list(csv.DictReader(io.StringIO(output)))
+    assert rows[0]["L2.reads"] == ""
+    assert rows[0]["victim_cache.hits"] == ""
+    assert rows[0]["AAT"] == ""
+    assert rows[1]["L2.reads"] != ""
+    assert rows[2]["victim_cache.hits"] != ""
+    assert rows[2]["AAT"] != ""
@@ -0,0 +1,141 @@
+"""
+Module: test_service.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module checks the streamed trace handling of the simulation service
+when several connections share it.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sim_service import SimulationService  # noqa: E402
+
+CONFIG = {"block_size": 16, "L1_size": 1024, "L1_assoc": 2}
+
+
+# runs a coroutine function with a single worker service from the repository root
+def run_service(monkeypatch, scenario):
+    monkeypatch.chdir(ROOT)
+
+    async def main():
+        service = SimulationService(workers=1)
+        try:
+            return await scenario(service)
+        finally:
+            service.close()
+
+    return asyncio.run(main())
+
+
+# streams a whole trace for a client connection
+async def stream(service, name, data, client):
+    await service.handle_request(
+        {"op": "trace_chunk", "name": name, "data": data}, client
+    )
+    return await service.handle_request({"op": "trace_end", "name": name}, client)
+
+
+def test_queued_job_keeps_spool_file_of_replaced_trace(monkeypatch):
+    async def scenario(service):
+        first, second = object(), object()
+        await stream(service, "t1", "r 1a2b3c4d\nw 1a2b3c50\n", first)
+        old_path = service.traces["t1"][0]
+
+        # a long job holds the only worker while the job on t1 waits in the queue
+        await service.handle_request({"op": "load_trace", "name": "gcc_trace.txt"})
+        busy = asyncio.ensure_future(
+            service.handle_request(
+                {"op": "run", "trace": "gcc_trace.txt", "config": CONFIG}, first
+            )
+        )
+        queued = asyncio.ensure_future(
+            service.handle_request(
+                {"op": "run", "trace": "t1", "config": CONFIG}, first
+            )
+        )
+        await asyncio.sleep(0.1)
+        assert service.jobs.get(old_path) == 1
+
+        await stream(service, "t1", "r 1a2b3c4d\n", second)
+        assert os.path.exists(old_path)
+
+        await busy
+        result = await queued
+        assert result["L1"]["reads"] == 1
+        assert result["L1"]["writes"] == 1
+        assert not os.path.exists(old_path)
+        assert os.listdir(service.spool.name) == [
+            os.path.basename(service.traces["t1"][0])
+        ]
+
+    run_service(monkeypatch, scenario)
+
+
+def test_stream_is_owned_by_its_connection(monkeypatch):
+    async def scenario(service):
+        first, second = object(), object()
+        await service.handle_request(
+            {"op": "trace_chunk", "name": "s", "data": "r 1a2b3c4d\nw 1a2"}, first
+        )
+        with pytest.raises(ValueError, match="another connection"):
+            await service.handle_request(
+                {"op": "trace_chunk", "name": "s", "data": "b3c50\n"}, second
+            )
+        with pytest.raises(ValueError, match="another connection"):
+            await service.handle_request({"op": "trace_end", "name": "s"}, second)
+
+        result = await service.handle_request(
+            {"op": "trace_chunk", "name": "s", "data": "b3c50\n"}, first
+        )
+        assert result["requests"] == 2
+
+    run_service(monkeypatch, scenario)
+
+
+def test_malformed_chunk_keeps_pending_state(monkeypatch):
+    async def scenario(service):
+        client = object()
+        await service.handle_request(
+            {"op": "trace_chunk", "name": "t", "data": "r 1a2b3c4d\nw 1a2"}, client
+        )
+        await service.handle_request(
+            {"op": "trace_chunk", "name": "t", "data": "b3c50\nr"}, client
+        )
+        with pytest.raises(ValueError, match="line 3"):
+            await service.handle_request({"op": "trace_end", "name": "t"}, client)
+        assert service.pending["t"][:2] == ("r", 2)
+
+        result = await stream(service, "t", " 1a2b3c60\n", client)
+        assert result["requests"] == 3
+
+    run_service(monkeypatch, scenario)
+
+
+@pytest.mark.parametrize("name", ["../sim_cache.py", "traces/gcc_trace.txt", ".."])
+def test_trace_names_must_be_file_names(monkeypatch, name):
+    async def scenario(service):
+        with pytest.raises(ValueError, match="invalid trace name"):
+            await service.handle_request({"op": "load_trace", "name": name})
+
+    run_service(monkeypatch, scenario)
+
+
+def test_run_rejects_invalid_config(monkeypatch):
+    async def scenario(service):
+        for config in (
+            {"L1_size": 1024, "L1_assoc": 2},
+            dict(CONFIG, compress="false"),
+            dict(CONFIG, L2size=8192),
+        ):
+            with pytest.raises(ValueError):
+                await service.handle_request(
+                    {"op": "run", "trace": "gcc_trace.txt", "config": config}
+                )
+
+    run_service(monkeypatch, scenario)
@@ -0,0 +1,144 @@
+"""
+Module: test_timing.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module checks the AAT of the timing model against the closed form of a
+blocking hierarchy, and the effect of MSHRs, bandwidth and the victim cache hit time.
+"""
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from sim_cache import CacheSimulator  # noqa: E402
+from timing import TimingModel, latency_bucket  # noqa: E402
+from trace_reader import read_trace_file  # noqa: E402
+
+TRACE = read_trace_file(os.path.join(ROOT, "traces", "gcc_trace.txt"))[:30000]
+
+L1_HIT_TIME = 0.5
+L2_HIT_TIME = 2.0
+MEMORY_LATENCY = 100.0
+
+
+# simulates a two level hierarchy with the given timing model options
+def simulate_two_levels(**options):
+    timing_model = TimingModel(
+        [L1_HIT_TIME, L2_HIT_TIME], 32, memoryLatency=MEMORY_LATENCY, **options
+    )
+    return CacheSimulator(
+        32,
+        1024,
+        4,
+        16384,
+        8,
+        "0",
+        "0",
+        "gcc_trace.txt",
+        timing_model=timing_model,
+        trace=TRACE,
+    ).run()
+
+
+def test_blocking_aat_matches_closed_form():
+    results = simulate_two_levels()
+    L1_misses = results.L1["read_misses"] + results.L1["write_misses"]
+    L1_miss_rate = L1_misses / (results.L1["reads"] + results.L1["writes"])
+    expected = L1_HIT_TIME + L1_miss_rate * (
+        L2_HIT_TIME + results.L2_miss_rate * MEMORY_LATENCY
+    )
+    assert results.AAT == pytest.approx(expected)
+    assert results.effective_access_time == pytest.approx(results.AAT)
+
+
+@pytest.mark.parametrize("mshrs", [1, 2, 8])
+def test_mshrs_do_not_exceed_blocking_aat(mshrs):
+    blocking = simulate_two_levels()
+    overlapped = simulate_two_levels(mshrs=mshrs)
+    assert overlapped.AAT <= blocking.AAT + 1e-9
+    assert overlapped.memory_level_parallelism >= 1.0
+
+
+def test_more_mshrs_expose_memory_level_parallelism():
+    one = simulate_two_levels(mshrs=1)
+    many = simulate_two_levels(mshrs=16)
+    assert many.AAT < one.AAT
+    assert many.memory_level_parallelism > 1.0
+
+
+def test_bandwidth_adds_transfer_time_to_memory_accesses():
+    results = simulate_two_levels()
+    limited = simulate_two_levels(bandwidth=8.0)
+    accesses = results.L1["reads"] + results.L1["writes"]
+    memory_accesses = results.L2["read_misses"]
+    transfer_time = 32 / 8.0
+    assert limited.AAT - results.AAT == pytest.approx(
+        memory_accesses * transfer_time / accesses
+    )
+
+
+def test_victim_hit_time_is_added_to_victim_cache_hits():
+    def simulate(victim_hit_time):
+        timing_model = TimingModel(
+            [L1_HIT_TIME], 32, memoryLatency=100.0, victimHitTime=victim_hit_time
+        )
+        return CacheSimulator(
+            32,
+            1024,
+            4,
+            0,
+            0,
+            "0",
+            "0",
+            "gcc_trace.txt",
+            timing_model=timing_model,
+            victim_entries=8,
+            trace=TRACE,
+        ).run()
+
+    free = simulate(0.0)
+    timed = simulate(0.25)
+    assert free.victim_cache["hits"] > 0
+    assert timed.AAT - free.AAT == pytest.approx(
+        free.victim_cache["hits"] * 0.25 / len(TRACE)
+    )
+
+
+def test_victim_cache_requires_hit_time():
+    with pytest.raises(ValueError):
+        CacheSimulator(
+            32,
+            1024,
+            4,
+            0,
+            0,
+            "0",
+            "0",
+            "gcc_trace.txt",
+            timing_model=TimingModel([L1_HIT_TIME], 32),
+            victim_entries=8,
+            trace=TRACE,
+        )
+
+
+@pytest.mark.parametrize(
+    "options", [{"mshrs": -1}, {"bandwidth": 0}, {"bandwidth": -8.0}]
+)
+def test_invalid_timing_inputs_are_rejected(options):
+    with pytest.raises(ValueError):
+        TimingModel([L1_HIT_TIME], 32, **options)
+
+
+def test_latency_histogram_uses_power_of_two_buckets():
+    assert latency_bucket(0.0) == 0.0
+    assert latency_bucket(0.19) == 0.125
+    assert latency_bucket(1.0) == 1.0
+    assert latency_bucket(102.5) == 64.0
+
+    results = simulate_two_levels(mshrs=4)
+    assert sum(results.latency_histogram.values()) == len(TRACE)
+    for bucket in results.latency_histogram:
+        assert bucket == latency_bucket(bucket)
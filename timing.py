@@ -0,0 +1,243 @@
+"""
+Module: timing.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains the latency model used by the simulator to compute the
+average access time (AAT) and a latency histogram of the memory hierarchy.
+"""
+import csv
+import heapq
+from math import frexp, ldexp
+
+# level of an access serviced by the victim cache after an L1 miss
+VICTIM_CACHE_HIT = 0
+
+
+# loads a CACTI-style table (size,assoc,block_size,access_time) into a dictionary
+def load_cacti_table(path):
+    table = {}
+    with open(path, "r") as file:
+        for row in csv.DictReader(file):
+            key = (int(row["size"]), int(row["assoc"]), int(row["block_size"]))
+            table[key] = float(row["access_time"])
+    return table
+
+
+# returns the access time of a cache configuration from a CACTI table
+def lookup_hit_time(table, size, assoc, block_size):
+    key = (int(size), int(assoc), int(block_size))
+    if key not in table:
+        raise ValueError(
+            f"no CACTI entry for size={size} assoc={assoc} block_size={block_size}"
+        )
+    return table[key]
+
+
+# returns the lower bound of the power-of-two bucket [bound, 2 * bound) of a latency
+def latency_bucket(latency):
+    if latency <= 0:
+        return 0.0
+    return ldexp(0.5, frexp(latency)[1])
+
+
+class TimingModel:
+    def __init__(
+        self,
+        hitTimes,
+        blockSize,
+        memoryLatency=100.0,
+        bandwidth=None,
+        mshrs=0,
+        victimHitTime=None,
+    ):
+        if bandwidth is not None and bandwidth <= 0:
+            raise ValueError(f"bandwidth must be positive, got {bandwidth}")
+        if mshrs < 0:
+            raise ValueError(f"mshrs must be 0 (blocking) or positive, got {mshrs}")
+
+        # timing attributes, all latencies share the unit of the CACTI table (ns)
+        self.hit_times = list(hitTimes)  # hit latency of L1, L2, ...
+        self.block_size = blockSize
+        self.memory_latency = memoryLatency
+        self.bandwidth = bandwidth  # bytes per time unit, None for infinite bandwidth
+        self.mshrs = mshrs  # 0 models a blocking cache with a fixed miss penalty
+        self.victim_hit_time = victimHitTime  # probe and swap after an L1 miss
+
+        # time taken to move one block over the memory bus
+        if self.bandwidth is not None:
+            self.transfer_time = self.block_size / float(self.bandwidth)
+        else:
+            self.transfer_time = 0.0
+
+        # timing metrics
+        self.accesses = 0
+        self.total_latency = 0.0
+        self.histogram = {}
+
+        # MSHR state: clock of the processor, busy time of the memory bus and
+        # the completion time of every outstanding block miss
+        self.clock = 0.0
+        self.bus_free = 0.0
+        self.outstanding = {}
+        self.completion_heap = []
+
+        # memory-level parallelism: total latency of the misses to memory and the
+        # time during which at least one of them was outstanding
+        self.miss_latency = 0.0
+        self.miss_busy_time = 0.0
+        self.miss_busy_end = 0.0
+
+    # builds a timing model from the hit times in a CACTI table
+    @classmethod
+    def from_cacti_table(
+        cls,
+        table,
+        blockSize,
+        levels,
+        memoryLatency=100.0,
+        bandwidth=None,
+        mshrs=0,
+        victimHitTime=None,
+    ):
+        hitTimes = [
+            lookup_hit_time(table, size, assoc, blockSize) for size, assoc in levels
+        ]
+        return cls(hitTimes, blockSize, memoryLatency, bandwidth, mshrs, victimHitTime)
+
+    # returns the time spent looking up the caches up to the given level
+    def _lookup_latency(self, level):
+        if level == VICTIM_CACHE_HIT:
+            return self.hit_times[0] + self.victim_hit_time
+        return sum(self.hit_times[: min(level, len(self.hit_times))])
+
+    # returns the latency of an access serviced by a level, len(hit_times) + 1 is
+    # the memory
+    def _service_latency(self, level):
+        latency = self._lookup_latency(level)
+        if level > len(self.hit_times):
+            latency += self.memory_latency + self.transfer_time
+        return latency
+
+    # retires the misses that completed before the current clock
+    def _retire_misses(self):
+        while self.completion_heap and self.completion_heap[0][0] <= self.clock:
+            completion, block = heapq.heappop(self.completion_heap)
+            if self.outstanding.get(block) == completion:
+                del self.outstanding[block]
+
+    # accounts a miss to memory outstanding from issue to completion
+    def _record_miss(self, issue, completion):
+        self.miss_latency += completion - issue
+        self.miss_busy_time += max(0.0, completion - max(issue, self.miss_busy_end))
+        self.miss_busy_end = max(self.miss_busy_end, completion)
+
+    # returns the latency of an access and the time the processor stalls on it when
+    # misses overlap in the MSHRs
+    def _mshr_latency(self, address, level):
+        self._retire_misses()
+        block = int(address, 16) // self.block_size
+        lookup = self._lookup_latency(level)
+
+        if block in self.outstanding:
+            # secondary access merges with the miss already in flight
+            latency = max(lookup, self.outstanding[block] - self.clock)
+            return latency, latency
+
+        if level <= len(self.hit_times):
+            return lookup, lookup
+
+        # primary miss, stall until an MSHR is free
+        stall = 0.0
+        while len(self.outstanding) >= self.mshrs:
+            completion, oldest = heapq.heappop(self.completion_heap)
+            if self.outstanding.get(oldest) == completion:
+                del self.outstanding[oldest]
+                stall = max(stall, completion - self.clock)
+
+        # memory requests are pipelined but block transfers share the bus
+        issue = self.clock + stall + lookup
+        completion = (
+            max(issue + self.memory_latency, self.bus_free) + self.transfer_time
+        )
+        self.bus_free = completion
+        self.outstanding[block] = completion
+        heapq.heappush(self.completion_heap, (completion, block))
+        self._record_miss(issue, completion)
+
+        # the miss is charged its lookup and service time, the wait for a free MSHR
+        # belongs to the misses it overlaps with and only stalls the processor
+        return completion - issue + lookup, stall + lookup
+
+    # accumulates the latency of an access serviced by the given level
+    def record_access(self, address, level):
+        if self.mshrs > 0:
+            latency, stall = self._mshr_latency(address, level)
+        else:
+            latency = self._service_latency(level)
+            stall = latency
+            if level > len(self.hit_times):
+                issue = self.clock + sum(self.hit_times)
+                self._record_miss(issue, self.clock + latency)
+
+        self.accesses += 1
+        self.total_latency += latency
+        self.clock += stall
+        bucket = latency_bucket(latency)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    # accumulates the latency of repeated L1 hits to the same block
+    def record_repeated_hits(self, address, count):
+        if self.mshrs > 0:
+            # hits wait for the miss of the block while it is in flight
+            block = int(address, 16) // self.block_size
+            while count > 0:
+                self._retire_misses()
+                if block not in self.outstanding:
+                    break
+                self.record_access(address, 1)
+                count -= 1
+            if count == 0:
+                return
+
+        latency = self.hit_times[0]
+        self.accesses += count
+        self.total_latency += latency * count
+        self.clock += latency * count
+        bucket = latency_bucket(latency)
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + count
+
+    # returns the average access time, with MSHRs the elapsed time per access so that
+    # the time of overlapping misses is counted once
+    def average_access_time(self):
+        if self.accesses == 0:
+            return 0.0
+        if self.mshrs > 0:
+            return self.effective_access_time()
+        return self.total_latency / self.accesses
+
+    # returns the elapsed time per access, where overlapping misses are counted once
+    def effective_access_time(self):
+        if self.accesses == 0:
+            return 0.0
+        return max(self.clock, self.miss_busy_end) / self.accesses
+
+    # returns the average number of outstanding misses while any miss is outstanding
+    def memory_level_parallelism(self):
+        if self.miss_busy_time == 0:
+            return 0.0
+        return self.miss_latency / self.miss_busy_time
+
+    # returns the number of accesses in every power-of-two latency bucket, sorted
+    def latency_histogram(self):
+        return dict(sorted(self.histogram.items()))
+
+    # prints the timing metrics
+    def print_timing_metrics(self):
+        print("===== Timing results =====")
+        print(f"average access time:          {self.average_access_time():6f}")
+        print(f"effective access time:        {self.effective_access_time():6f}")
+        print(f"memory-level parallelism:     {self.memory_level_parallelism():6f}")
+        print("latency histogram:")
+        for bucket, count in self.latency_histogram().items():
+            interval = f"[{bucket:g}, {2 * bucket:g})"
+            print(f"  {interval:<22} {count}")
@@ -0,0 +1,240 @@
+"""
+Module: trace_analytics.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module characterizes a trace before running simulations:
+unique block footprint, read/write mix, per-set access distribution and reuse-time
+histogram. The exact analysis groups the decoded trace with NumPy, the streaming
+analysis estimates the footprint of huge traces with HyperLogLog.
+"""
+import argparse
+import hashlib
+import json
+import os
+from math import log
+
+import numpy as np
+
+from sim_config import is_power_of_two
+from trace_reader import iter_trace, read_trace
+
+
+# returns the block addresses of the byte addresses
+def block_addresses(addresses, block_size):
+    return addresses >> (block_size.bit_length() - 1)
+
+
+# decodes (operation, address) requests into address and write-flag arrays
+def decode_trace(trace):
+    addresses = np.fromiter(
+        (int(address, 16) for _, address in trace), dtype=np.uint64, count=len(trace)
+    )
+    writes = np.fromiter(
+        (mode == "w" for mode, _ in trace), dtype=bool, count=len(trace)
+    )
+    return addresses, writes
+
+
+# returns the number of unique blocks touched for every block size
+def block_footprint(addresses, block_sizes):
+    return {
+        block_size: int(np.unique(block_addresses(addresses, block_size)).size)
+        for block_size in block_sizes
+    }
+
+
+# returns the read/write mix of the trace
+def read_write_mix(writes):
+    write_count = int(np.count_nonzero(writes))
+    return {
+        "reads": int(writes.size - write_count),
+        "writes": write_count,
+        "write_fraction": write_count / writes.size if writes.size else 0.0,
+    }
+
+
+# returns the number of accesses mapped to every set, and summary statistics that
+# show conflict hot spots, for every candidate set count
+def set_distribution(addresses, block_size, set_counts):
+    blocks = block_addresses(addresses, block_size)
+    output = {}
+    for sets in set_counts:
+        counts = np.bincount(
+            (blocks & np.uint64(sets - 1)).astype(np.int64), minlength=sets
+        )
+        mean = counts.mean()
+        output[sets] = {
+            "max": int(counts.max()),
+            "min": int(counts.min()),
+            "mean": float(mean),
+            "max_over_mean": float(counts.max() / mean) if mean else 0.0,
+            "coefficient_of_variation": float(counts.std() / mean) if mean else 0.0,
+            "hottest_sets": [int(i) for i in np.argsort(counts)[::-1][:8]],
+            "counts": counts.tolist(),
+        }
+    return output
+
+
+# returns the histogram of reuse times (accesses between two accesses to the same
+# block) in power-of-two buckets, and the number of first-time (cold) accesses
+def reuse_time_histogram(addresses, block_size):
+    blocks = block_addresses(addresses, block_size)
+    order = np.argsort(blocks, kind="stable")
+    sorted_blocks = blocks[order]
+    same_block = sorted_blocks[1:] == sorted_blocks[:-1]
+    reuse_times = (order[1:] - order[:-1])[same_block]
+
+    buckets = (
+        np.bincount(np.log2(reuse_times).astype(np.int64)) if reuse_times.size else []
+    )
+    return {
+        "cold": int(blocks.size - reuse_times.size),
+        "histogram": {2**i: int(count) for i, count in enumerate(buckets) if count},
+    }
+
+
+# runs the exact analysis over a decoded trace
+def analyze_trace(trace, block_sizes, set_counts):
+    addresses, writes = decode_trace(trace)
+    return {
+        "requests": int(addresses.size),
+        "mix": read_write_mix(writes),
+        "footprint": block_footprint(addresses, block_sizes),
+        "sets": {
+            block_size: set_distribution(addresses, block_size, set_counts)
+            for block_size in block_sizes
+        },
+        "reuse": {
+            block_size: reuse_time_histogram(addresses, block_size)
+            for block_size in block_sizes
+        },
+    }
+
+
+class HyperLogLog:
+    def __init__(self, precision=14):
+        # 2^precision registers, standard error is about 1.04 / sqrt(2^precision)
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+        if self.m >= 128:
+            self.alpha = 0.7213 / (1 + 1.079 / self.m)
+        else:
+            self.alpha = {16: 0.673, 32: 0.697, 64: 0.709}[self.m]
+
+    # adds an integer value to the sketch
+    def add(self, value):
+        digest = hashlib.blake2b(value.to_bytes(8, "little"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "little")
+        register = hashed & (self.m - 1)
+        remaining = hashed >> self.precision
+        rank = 64 - self.precision - remaining.bit_length() + 1
+        if rank > self.registers[register]:
+            self.registers[register] = rank
+
+    # returns the estimated number of distinct values
+    def count(self):
+        estimate = self.alpha * self.m * self.m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.m and zeros:
+            # small range correction
+            return int(round(self.m * log(self.m / zeros)))
+        return int(round(estimate))
+
+
+# runs the streaming analysis over a text or binary trace file, estimating the footprint
+# with HyperLogLog
+def analyze_trace_streaming(trace_file, block_sizes, precision=14):
+    sketches = {block_size: HyperLogLog(precision) for block_size in block_sizes}
+    offsets = {block_size: block_size.bit_length() - 1 for block_size in block_sizes}
+    reads = 0
+    writes = 0
+    for mode, address in iter_trace(trace_file):
+        if mode == "r":
+            reads += 1
+        else:
+            writes += 1
+        address = int(address, 16)
+        for block_size, sketch in sketches.items():
+            sketch.add(address >> offsets[block_size])
+
+    total = reads + writes
+    return {
+        "requests": total,
+        "mix": {
+            "reads": reads,
+            "writes": writes,
+            "write_fraction": writes / total if total else 0.0,
+        },
+        "footprint": {
+            block_size: sketch.count() for block_size, sketch in sketches.items()
+        },
+    }
+
+
+# prints the analysis report
+def print_report(report):
+    print("===== Trace characterization =====")
+    print(f"requests:              {report['requests']}")
+    mix = report["mix"]
+    print(f"reads:                 {mix['reads']}")
+    print(f"writes:                {mix['writes']}")
+    print(f"write fraction:        {mix['write_fraction']:6f}")
+    print("===== Unique block footprint =====")
+    for block_size, blocks in report["footprint"].items():
+        print(
+            f"BLOCKSIZE {block_size:<6}       {blocks} blocks "
+            f"({blocks * block_size} bytes)"
+        )
+    for block_size, distributions in report.get("sets", {}).items():
+        print(f"===== Set distribution (BLOCKSIZE {block_size}) =====")
+        for sets, distribution in distributions.items():
+            print(
+                f"sets {sets:<8} max/mean {distribution['max_over_mean']:.2f}  "
+                f"cv {distribution['coefficient_of_variation']:.2f}  "
+                f"hottest {distribution['hottest_sets'][:4]}"
+            )
+    for block_size, reuse in report.get("reuse", {}).items():
+        print(f"===== Reuse time histogram (BLOCKSIZE {block_size}) =====")
+        print(f"cold:                  {reuse['cold']}")
+        for bucket, count in reuse["histogram"].items():
+            interval = f"[{bucket}, {2 * bucket})"
+            print(f"{interval:<22} {count}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="trace working-set and reuse analytics"
+    )
+    parser.add_argument("trace_file")
+    parser.add_argument("--block-sizes", type=int, nargs="+", default=[16, 32, 64])
+    parser.add_argument(
+        "--sets", type=int, nargs="+", default=[2**i for i in range(3, 11)]
+    )
+    parser.add_argument(
+        "--streaming",
+        action="store_true",
+        help="estimate the footprint with HyperLogLog without keeping the trace in "
+        "memory",
+    )
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    args = parser.parse_args()
+
+    if not os.path.isfile("traces/" + args.trace_file):
+        parser.error(f"trace file traces/{args.trace_file} does not exist")
+    for block_size in args.block_sizes:
+        if not is_power_of_two(block_size):
+            parser.error(f"block sizes must be powers of two, got {block_size}")
+    for sets in args.sets:
+        if not is_power_of_two(sets):
+            parser.error(f"set counts must be powers of two, got {sets}")
+
+    if args.streaming:
+        report = analyze_trace_streaming(args.trace_file, args.block_sizes)
+    else:
+        report = analyze_trace(read_trace(args.trace_file), args.block_sizes, args.sets)
+
+    if args.format == "json":
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
@@ -0,0 +1,135 @@
+"""
+Module: trace_reader.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains the functions that decode text and binary
+trace files into (operation, address) requests, encode binary traces and run-length
+compress traces.
+"""
+from array import array
+import os
+import sys
+
+from utils import fixAddress
+
+# binary traces start with this header, followed by the number of requests, one
+# operation byte per request and one little-endian 32-bit address per request
+BINARY_TRACE_MAGIC = b"SIMTRACE"
+
+
+# decodes trace lines into (operation, address) requests, first_line numbers the
+# first line in the error raised for a malformed line
+def parse_trace_lines(lines, first_line=1):
+    requests = []
+    for number, line in enumerate(lines, first_line):
+        if line.strip() == "":
+            continue
+        fields = line.split()
+        if len(fields) != 2 or fields[0] not in ("r", "w"):
+            raise ValueError(f"line {number}: malformed trace line {line!r}")
+        try:
+            int(fields[1], 16)
+        except ValueError:
+            raise ValueError(f"line {number}: invalid address in trace line {line!r}")
+        requests.append((fields[0], fixAddress(fields[1])))
+    return requests
+
+
+# decodes the contents of a binary trace into (operation, address) requests
+def parse_binary_trace(data):
+    count = int.from_bytes(
+        data[len(BINARY_TRACE_MAGIC) : len(BINARY_TRACE_MAGIC) + 4], "little"
+    )
+    start = len(BINARY_TRACE_MAGIC) + 4
+    modes = data[start : start + count].decode("ascii")
+    addresses = array("I")
+    addresses.frombytes(data[start + count : start + count + 4 * count])
+    if sys.byteorder != "little":
+        addresses.byteswap()
+    return [(mode, format(address, "08x")) for mode, address in zip(modes, addresses)]
+
+
+# encodes (operation, address) requests as a binary trace
+def encode_binary_trace(trace):
+    addresses = array("I", (int(address, 16) for _, address in trace))
+    if sys.byteorder != "little":
+        addresses.byteswap()
+    return (
+        BINARY_TRACE_MAGIC
+        + len(trace).to_bytes(4, "little")
+        + "".join(mode for mode, _ in trace).encode("ascii")
+        + addresses.tobytes()
+    )
+
+
+# raises a ValueError unless the name is a plain file name, so that it cannot leave
+# the traces directory
+def check_trace_name(name):
+    if (
+        not isinstance(name, str)
+        or name in ("", ".", "..")
+        or os.path.basename(name) != name
+        or "\\" in name
+    ):
+        raise ValueError(
+            f"invalid trace name {name!r}, expected a file name in traces/"
+        )
+
+
+# reads and decodes a text or binary trace file at the given path
+def read_trace_file(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    if data.startswith(BINARY_TRACE_MAGIC):
+        return parse_binary_trace(data)
+    return parse_trace_lines(data.decode("ascii").splitlines())
+
+
+# reads and decodes a text or binary trace file from the traces directory
+def read_trace(trace_file):
+    return read_trace_file("traces/" + trace_file)
+
+
+# yields the (operation, address) requests of a text or binary trace file from the
+# traces directory, decoding at most chunk_requests requests of a binary trace at a time
+def iter_trace(trace_file, chunk_requests=65536):
+    with open("traces/" + trace_file, "rb") as file:
+        if file.read(len(BINARY_TRACE_MAGIC)) != BINARY_TRACE_MAGIC:
+            file.seek(0)
+            for number, line in enumerate(file, 1):
+                yield from parse_trace_lines([line.decode("ascii")], number)
+            return
+
+        # the operations and the addresses are stored in two sections
+        count = int.from_bytes(file.read(4), "little")
+        start = len(BINARY_TRACE_MAGIC) + 4
+        for first in range(0, count, chunk_requests):
+            size = min(chunk_requests, count - first)
+            file.seek(start + first)
+            modes = file.read(size).decode("ascii")
+            file.seek(start + count + 4 * first)
+            addresses = array("I")
+            addresses.frombytes(file.read(4 * size))
+            if sys.byteorder != "little":
+                addresses.byteswap()
+            for mode, address in zip(modes, addresses):
+                yield mode, format(address, "08x")
+
+
+# collapses runs of consecutive accesses to the same block into
+# (operation, address, reads, writes) records, where operation and address belong to
+# the first access of the run and reads/writes count the repeated accesses after it
+def compress_trace(trace, block_size):
+    records = []
+    previous_block = None
+    for mode, address in trace:
+        block = int(address, 16) // block_size
+        if block == previous_block:
+            if mode == "r":
+                records[-1][2] += 1
+            else:
+                records[-1][3] += 1
+        else:
+            records.append([mode, address, 0, 0])
+            previous_block = block
+    return [tuple(record) for record in records]
@@ -0,0 +1,74 @@
+"""
+Module: victim_cache.py
+Author: cache-simulator contributors
+Date: October 19, 2026
+Description: This module contains the Class VictimCache, a small fully-associative cache
+that holds the blocks evicted from L1.
+"""
+from math import log2
+from collections import OrderedDict
+
+
+class VictimCache:
+    def __init__(self, blockSize, entries, inclusionPolicy):
+        # victim cache attributes
+        self.block_size = blockSize
+        self.entries = entries
+        self.inclusion = inclusionPolicy
+        self.offset_width = int(log2(blockSize))
+        self.evictedAddress = None
+        self.evictedDirty = False
+        self.evicted = False
+
+        # victim cache metrics
+        self.requests = 0
+        self.hits = 0
+        self.misses = 0
+        self.write_backs = 0
+        self.mem_write_back = 0
+
+        # block address -> [address, dirty bit], ordered from LRU to MRU
+        self.blocks = OrderedDict()
+
+    # returns the block address used as the tag of the fully-associative cache
+    def _get_block_address(self, address):
+        return int(address, 16) >> self.offset_width
+
+    # processes a lookup of an L1 miss, returns True on a hit
+    def cache_request(self, address):
+        self.requests += 1
+        if self._get_block_address(address) in self.blocks:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    # removes a block that moves back to L1, returns its dirty bit
+    def remove_block(self, address):
+        entry = self.blocks.pop(self._get_block_address(address), None)
+        if entry is None:
+            return False
+        return entry[1]
+
+    # inserts a block evicted from L1, evicting the LRU block when full
+    def insert_block(self, address, dirty):
+        self.evicted = False
+        self.evictedAddress = None
+        self.evictedDirty = False
+        if len(self.blocks) >= self.entries:
+            evictedAddress, evictedDirty = self.blocks.popitem(last=False)[1]
+            if evictedDirty:
+                self.write_backs += 1
+            self.evicted = True
+            self.evictedAddress = evictedAddress
+            self.evictedDirty = evictedDirty
+
+        self.blocks[self._get_block_address(address)] = [address, dirty]
+
+    # invalidates a block incase of inclusion violation
+    def invalidate_block(self, address):
+        if self.inclusion != "1":
+            return
+        entry = self.blocks.pop(self._get_block_address(address), None)
+        if entry is not None and entry[1]:
+            self.mem_write_back += 1  # victim cache to main memory write back